@@ -16,37 +16,134 @@ Or run directly:
 The dashboard will be available at http://localhost:5006
 """
 
-import logging
+import os
 
-import panel as pn
-import holoviews as hv
+# Native thread pools size themselves when NumPy is first imported, so pin
+# them before panel/holoviews pull it in; N cores x num_procs threads would
+# oversubscribe the machine. Explicit OMP_NUM_THREADS etc. still win.
+for _var in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS'):
+    os.environ.setdefault(_var, os.environ.get('VVMVIZ_COMPUTE_THREADS', '1'))
+
+import queue  # noqa: E402
+import atexit  # noqa: E402
+import logging  # noqa: E402
+import logging.handlers  # noqa: E402
+
+import panel as pn  # noqa: E402
+import holoviews as hv  # noqa: E402
 
 # Suppress Bokeh warnings
-from bokeh.core.validation import silence
-from bokeh.core.validation.warnings import FIXED_SIZING_MODE
+from bokeh.core.validation import silence  # noqa: E402
+from bokeh.core.validation.warnings import FIXED_SIZING_MODE  # noqa: E402
 silence(FIXED_SIZING_MODE, True)
 
-# Initialize extensions
-hv.extension('bokeh')
-hv.config.image_rtol = 1.0
-pn.extension(notifications=True)
-
 # Import VVMViz modules
+from vvmviz.config import config  # noqa: E402
 from vvmviz.ui import create_dashboard
+from vvmviz.plotting import preload_boundaries
 from vvmviz.controllers import VVMVizController
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        #logging.FileHandler('vvmviz_debug.log', mode='a')
-    ]
-)
+
+# Configure logging: records are queued on the calling thread and written to
+# stderr by a background listener, so log I/O never blocks the event loop
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """Install a QueueHandler on the root logger, drained by a new listener."""
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    )
+    #file_handler = logging.FileHandler('vvmviz_debug.log', mode='a')
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+    return listener
+
+
+def _configure_logging():
+    root = logging.getLogger()
+    # panel serve re-executes this module per session; configure only once
+    if any(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers):
+        return
+
+    listener = _start_log_listener()
+    root.setLevel(logging.INFO)
+
+    # Threads do not survive fork: num_procs workers get their own queue and
+    # listener (the parent's listener cannot be restarted)
+    def after_fork_in_child():
+        atexit.unregister(listener.stop)
+        for handler in list(root.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                root.removeHandler(handler)
+        _start_log_listener()
+
+    os.register_at_fork(after_in_child=after_fork_in_child)
+
+
+_configure_logging()
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# Extension Initialization
+# =============================================================================
+
+_EXT_READY = False
+
+
+def init_extensions():
+    """Initialize HoloViews/Panel extensions once per interpreter."""
+    global _EXT_READY
+    if _EXT_READY:
+        return
+
+    hv.extension('bokeh')
+    hv.config.image_rtol = 1.0
+
+    pn.extension(notifications=config.notifications)
+    _EXT_READY = True
+
+
+def prewarm():
+    """
+    Warm extension and model registries before forking server workers.
+
+    Builds a throwaway dashboard so Bokeh/HoloViews populate their model and
+    plotting registries in the parent process; workers forked by
+    ``pn.serve(..., num_procs=N)`` inherit them instead of paying the cost
+    on their first session. Boundary shapefiles are parsed here too, so
+    workers share the vertex arrays copy-on-write.
+    """
+    init_extensions()
+    preload_boundaries()
+    create_dashboard({"-": ["-"]})
+
+
+def limit_compute_threads():
+    """
+    Apply config.num_compute_threads to already-loaded native thread pools.
+
+    Covers values set in the user config file, which is read after NumPy is
+    imported. Needs threadpoolctl; without it only the environment variables
+    set at the top of this module apply.
+    """
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        return
+    threadpool_limits(limits=config.num_compute_threads)
+
+
+init_extensions()
+limit_compute_threads()
+
+
 # =============================================================================
 # Main Dashboard Assembly
 # =============================================================================
@@ -114,21 +211,23 @@ def main():
     """Main entry point when running as script."""
     logger.info("Starting VVMViz Dashboard Application")
 
-    dashboard = create_vvmviz_dashboard()
+    prewarm()
 
     logger.info("Serving dashboard on http://localhost:5006")
+    # Pass the factory so each session builds its own dashboard
     pn.serve(
-        dashboard,
+        {'/': create_vvmviz_dashboard},
         port=5006,
         title="VVM Visualization Dashboard",
         show=True,
-        autoreload=False
+        autoreload=False,
+        num_procs=config.num_procs
     )
 
 
-# For panel serve
-dashboard = create_vvmviz_dashboard()
-dashboard.servable(title="VVM Visualization Dashboard")
+# For panel serve (only when executed inside a Bokeh session)
+if pn.state.curdoc is not None:
+    create_vvmviz_dashboard().servable(title="VVM Visualization Dashboard")
 
 
 if __name__ == '__main__':
@@ -49,26 +49,45 @@ from vvmviz.core.data_processor import (
     load_frame_bundle
 )
 
-# Plotting layer
-from vvmviz.plotting.base import create_main_plot
-from vvmviz.plotting.colormaps import (
-    get_variable_default,
-    resolve_colormap,
-    NCL_CMAP_CATEGORIES
-)
-from vvmviz.plotting.overlays import (
-    create_wind_vectors,
-    create_contour_overlay,
-    get_county_boundaries,
-    get_town_boundaries
-)
+# Plotting, utility and UI layers are imported lazily (PEP 562) so that
+# `import vvmviz` does not pull in HoloViews/Panel for headless data scripts
+_LAZY_IMPORTS = {
+    # Plotting layer
+    'create_main_plot': 'vvmviz.plotting.base',
+    'get_variable_default': 'vvmviz.plotting.colormaps',
+    'resolve_colormap': 'vvmviz.plotting.colormaps',
+    'NCL_CMAP_CATEGORIES': 'vvmviz.plotting.colormaps',
+    'create_wind_vectors': 'vvmviz.plotting.overlays',
+    'create_contour_overlay': 'vvmviz.plotting.overlays',
+    'get_county_boundaries': 'vvmviz.plotting.overlays',
+    'get_town_boundaries': 'vvmviz.plotting.overlays',
+
+    # Utilities
+    'get_cache_manager': 'vvmviz.utils.cache',
+    'CacheManager': 'vvmviz.utils.cache',
+    'build_metadata_markdown': 'vvmviz.utils.metadata',
+    'format_time_value': 'vvmviz.utils.metadata',
+
+    # UI components
+    'create_dashboard': 'vvmviz.ui',
+    'DomainMapSelector': 'vvmviz.ui',
+    'PlaybackController': 'vvmviz.ui',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
-# Utilities
-from vvmviz.utils.cache import get_cache_manager, CacheManager
-from vvmviz.utils.metadata import build_metadata_markdown, format_time_value
 
-# UI components
-from vvmviz.ui import create_dashboard, DomainMapSelector, PlaybackController
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 __all__ = [
     # Version
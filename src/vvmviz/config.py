@@ -5,10 +5,15 @@ This module contains all global configuration, constants, and default settings
 for the VVMViz application.
 """
 
+import os
 import logging
 import threading
+import weakref
 from pathlib import Path
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from functools import cache
+from typing import Any, Dict, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +25,110 @@ logger = logging.getLogger(__name__)
 # Global lock for NetCDF I/O operations to prevent HDF5 segfaults
 FILE_IO_LOCK = threading.RLock()
 
+# Whether the HDF5 library was built thread-safe. There is no reliable runtime
+# probe (h5py/netCDF4 do not expose the build flag), so this is opt-in via the
+# VVMVIZ_THREADSAFE_HDF5 environment variable. Only a thread-safe build may
+# read unrelated files concurrently; otherwise all I/O stays serialized.
+HDF5_THREADSAFE = os.environ.get('VVMVIZ_THREADSAFE_HDF5', '0') == '1'
+
+class SimRWLock:
+    """
+    Reader-writer lock for one simulation's files.
+
+    Entering the lock itself (``with lock:``) takes a shared read lock, so
+    concurrent readers of the same simulation do not serialize; ``write()``
+    takes it exclusively (e.g. to close cached file handles). Readers are
+    preferred, which keeps nested read sections re-entrant; writes are rare.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+
+    def acquire_read(self) -> None:
+        with self._cond:
+            while self._writer:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        with self._cond:
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writer = True
+
+    def release_write(self) -> None:
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+    def __enter__(self) -> 'SimRWLock':
+        self.acquire_read()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release_read()
+
+    @contextmanager
+    def write(self) -> Iterator['SimRWLock']:
+        """Hold the lock exclusively."""
+        self.acquire_write()
+        try:
+            yield self
+        finally:
+            self.release_write()
+
+
+# Per-path locks, dropped automatically once no caller holds a reference
+_FILE_LOCKS: 'weakref.WeakValueDictionary[str, SimRWLock]' = weakref.WeakValueDictionary()
+_FILE_LOCKS_GUARD = threading.Lock()
+
+
+def get_file_lock(path: Path | str, write: bool = False):
+    """
+    Get the lock guarding NetCDF I/O for a file or simulation directory.
+
+    With a thread-safe HDF5 build each path gets its own SimRWLock: reads
+    (the default) share it, so sessions reading the same simulation proceed
+    together and unrelated simulations never contend; ``write=True`` holds
+    it exclusively. Otherwise the global FILE_IO_LOCK is returned for both
+    and all I/O remains serialized.
+
+    Parameters
+    ----------
+    path : Path or str
+        File or simulation directory being read
+    write : bool, default=False
+        Whether the caller mutates shared handles (e.g. closes a dataset)
+
+    Returns
+    -------
+    context manager
+        Lock to hold (``with``) while touching HDF5 handles
+
+    Examples
+    --------
+    >>> with get_file_lock('/data2/VVM/sim001/'):
+    ...     ds = vvm.open_vvm_dataset('/data2/VVM/sim001/', variables=['qc'])
+    """
+    if not HDF5_THREADSAFE:
+        return FILE_IO_LOCK
+
+    key = str(path)
+    with _FILE_LOCKS_GUARD:
+        lock = _FILE_LOCKS.get(key)
+        if lock is None:
+            lock = SimRWLock()
+            _FILE_LOCKS[key] = lock
+    return lock.write() if write else lock
+
 
 # =============================================================================
 # Default Paths
@@ -32,6 +141,9 @@ DEFAULT_VVM_DIR = Path('/data2/VVM/taiwanvvm_summer/')
 TWCOUNTY_SHP_PATH = Path('/data/ckhsu/tw_county_town/county/COUNTY_MOI_1140318.shp')
 TWTOWN_SHP_PATH = Path('/data/ckhsu/tw_county_town/town/TOWN_MOI_1140318.shp')
 
+# User-level configuration file
+USER_CONFIG_PATH = Path.home() / '.vvmviz' / 'config.toml'
+
 
 # =============================================================================
 # Cache Settings
@@ -40,9 +152,89 @@ TWTOWN_SHP_PATH = Path('/data/ckhsu/tw_county_town/town/TOWN_MOI_1140318.shp')
 # Maximum number of frames to keep in memory cache
 MAX_FRAME_CACHE_SIZE = 200
 
-# Maximum number of datasets to cache (for @lru_cache decorator)
+# Byte budget for the frame cache (None = bounded by frame count only)
+FRAME_CACHE_BYTES = 4 << 30  # 4 GiB
+
+# Frame cache eviction policy: 'lru', 'fifo' or 'none'
+FRAME_CACHE_POLICY = 'lru'
+
+# Storage dtype for cached frames (None keeps the loaded precision).
+# Variables flagged precision_sensitive in VARIABLE_DEFAULTS, and frames with
+# values outside the dtype's range or too finely varied for it (see
+# CACHE_QUANTIZE_MIN_STEPS), are always kept at full precision.
+CACHE_DTYPE = None
+
+# A frame is only stored at CACHE_DTYPE if its value range spans at least
+# this many representable steps of that dtype (so it keeps ~12 bits of
+# detail, e.g. potential temperature near 300 K does not)
+CACHE_QUANTIZE_MIN_STEPS = 4096
+
+# Maximum number of datasets to cache (for the open_dataset cache)
 DATASET_CACHE_SIZE = 10
 
+# Byte budget for cached datasets (estimated from materialized data size)
+DATASET_CACHE_BYTES = 8 << 30
+
+# Target size of one Dask chunk when opening datasets (a few MiB keeps
+# per-task overhead low without holding whole large planes in one task)
+DASK_CHUNK_BYTES = 8 << 20
+
+# HDF5 chunk cache per open variable (netCDF-C default is a few MiB, smaller
+# than one compressed 3D chunk, so re-reads of a file hit the disk again)
+NC_CHUNK_CACHE_BYTES = 32 << 20
+NC_CHUNK_CACHE_SLOTS = 1009  # prime, per netCDF-C guidance
+
+# Number of upcoming time frames to prefetch into the frame cache
+PREFETCH_WINDOW = 10
+
+
+# =============================================================================
+# Rendering Settings
+# =============================================================================
+
+# Skip Datashader rasterization and send the frame as a plain image
+# (colormapped in the browser); faster per frame for moderate grid sizes
+FAST_IMAGE = False
+
+# Progressive rendering for large grids on the fast_image path: a coarse
+# pyramid level (every PREVIEW_FACTOR-th point) is painted first and the
+# full-resolution frame follows once the user stops on that frame
+PREVIEW_FACTOR = 4
+PREVIEW_MIN_SIZE = 1_000_000  # grid points
+PREVIEW_REFINE_DELAY_MS = 150
+
+# Minimum interval between widget-triggered plot updates; bursts of events
+# (slider drags, playback) are coalesced, and the interval grows to the
+# measured render time
+UPDATE_MIN_INTERVAL_MS = 250
+
+# Minimum interval between wind overlay rebuilds from zoom/pan range events;
+# intermediate ranges while panning are dropped and the latest one is used
+RANGE_DEBOUNCE_MS = 200
+
+# Toast notifications are queued and flushed after this delay, with
+# repeats of the same message merged into one toast
+NOTIFY_BATCH_MS = 100
+
+
+# =============================================================================
+# Server Settings
+# =============================================================================
+
+# Toast notifications; disabling drops the notification JS from every page
+NOTIFICATIONS = True
+
+# Number of worker processes forked by `python app.py` (pn.serve num_procs)
+SERVER_NUM_PROCS = 1
+
+# Worker processes for frame reads (0 = read in-process). HDF5 serializes
+# all calls within a process, so only separate processes read in parallel.
+IO_WORKERS = 0
+
+# Threads per process for BLAS/OpenMP kernels (VVMVIZ_COMPUTE_THREADS).
+# app.py exports it as OMP/MKL/OPENBLAS_NUM_THREADS before NumPy loads.
+COMPUTE_THREADS = int(os.environ.get('VVMVIZ_COMPUTE_THREADS', '1'))
+
 
 # =============================================================================
 # Variable Names
@@ -50,21 +242,71 @@ DATASET_CACHE_SIZE = 10
 
 TERRAIN_VAR_NAME = "terrain_height"
 
+# Column-integrated diagnostics: always read over the full vertical column
+COLUMN_INTEGRATED_VARS = frozenset({'cwv', 'iwp', 'lwp'})
+
 
 # =============================================================================
-# Colormap Definitions (imported from plotting module)
+# Colormap Definitions (lazily re-exported from plotting module)
 # =============================================================================
 
-# Import colormap definitions from plotting.colormaps (single source of truth)
-# This allows the plotting module to be self-contained while config can still
-# access these definitions if needed for backwards compatibility
-from vvmviz.plotting.colormaps import (
-    NCL_CMAP_CATEGORIES,
-    ALL_NCL_CMAPS,
-    DEFAULT_COLORMAP,
-    VARIABLE_DEFAULTS,
-    get_variable_default,
-)
+# Colormap definitions live in plotting.colormaps (single source of truth).
+# They are re-exported here for backwards compatibility, but imported lazily
+# (PEP 562) so that importing config does not pull in matplotlib.
+_COLORMAP_EXPORTS = frozenset({
+    'NCL_CMAP_CATEGORIES',
+    'ALL_NCL_CMAPS',
+    'DEFAULT_COLORMAP',
+    'VARIABLE_DEFAULTS',
+    'get_variable_default',
+})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _COLORMAP_EXPORTS:
+        from vvmviz.plotting import colormaps
+        value = getattr(colormaps, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# =============================================================================
+# Configuration File Parsing
+# =============================================================================
+
+@cache
+def _read_config_table(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse the [vvmviz] table of a TOML config file.
+
+    Cached on (path, mtime_ns) so repeated loads only cost a stat() until the
+    file changes. The returned dict is shared and must not be mutated.
+    """
+    import tomllib
+    with open(path, 'rb') as f:
+        data = tomllib.load(f)
+    return data.get('vvmviz', {})
+
+
+def _env_bool(value: str) -> bool:
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _env_dtype(value: str) -> str | None:
+    return None if value.strip().lower() in ('', 'none') else value.strip()
+
+
+# Environment overrides applied on top of the config file:
+# {variable: (field, parser)}
+_ENV_OVERRIDES = {
+    'VVMVIZ_IO_WORKERS': ('io_workers', int),
+    'VVMVIZ_NUM_PROCS': ('num_procs', int),
+    'VVMVIZ_FAST_IMAGE': ('fast_image', _env_bool),
+    'VVMVIZ_NOTIFICATIONS': ('notifications', _env_bool),
+    'VVMVIZ_CACHE_DTYPE': ('cache_dtype', _env_dtype),
+    'VVMVIZ_PREFETCH_WINDOW': ('prefetch_window', int),
+}
 
 
 # =============================================================================
@@ -87,10 +329,24 @@ class VVMVizConfig:
 
     # Cache settings
     max_frame_cache_size: int = MAX_FRAME_CACHE_SIZE
+    frame_cache_bytes: int | None = FRAME_CACHE_BYTES
+    frame_cache_policy: str = FRAME_CACHE_POLICY
+    cache_dtype: str | None = CACHE_DTYPE
     dataset_cache_size: int = DATASET_CACHE_SIZE
+    dataset_cache_bytes: int = DATASET_CACHE_BYTES
+    prefetch_window: int = PREFETCH_WINDOW
+
+    # Rendering settings
+    fast_image: bool = FAST_IMAGE
 
-    # UI defaults
-    default_colormap: str = DEFAULT_COLORMAP
+    # Server settings
+    num_procs: int = SERVER_NUM_PROCS
+    num_compute_threads: int = COMPUTE_THREADS
+    io_workers: int = IO_WORKERS
+    notifications: bool = NOTIFICATIONS
+
+    # UI defaults (None uses plotting.colormaps.DEFAULT_COLORMAP)
+    default_colormap: str | None = None
 
     @classmethod
     def load_from_file(cls, config_path: Path | None = None) -> 'VVMVizConfig':
@@ -112,37 +368,69 @@ class VVMVizConfig:
         search_paths = [
             config_path,
             Path.cwd() / 'config.toml',
-            Path.home() / '.vvmviz' / 'config.toml'
+            USER_CONFIG_PATH
         ]
 
         for path in search_paths:
-            if path and path.exists():
-                try:
-                    import tomllib
-                    with open(path, 'rb') as f:
-                        data = tomllib.load(f)
-                        vvmviz_config = data.get('vvmviz', {})
-
-                        # Create instance with loaded values
-                        return cls(
-                            default_vvm_dir=vvmviz_config.get('default_vvm_dir', cls.default_vvm_dir),
-                            county_shapefile=Path(vvmviz_config.get('county_shapefile', cls.county_shapefile)),
-                            town_shapefile=Path(vvmviz_config.get('town_shapefile', cls.town_shapefile)),
-                            max_frame_cache_size=vvmviz_config.get('max_frame_cache_size', cls.max_frame_cache_size),
-                            dataset_cache_size=vvmviz_config.get('dataset_cache_size', cls.dataset_cache_size),
-                            default_colormap=vvmviz_config.get('default_colormap', cls.default_colormap),
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to load config from {path}: {e}")
-                    # Fall through to use defaults
+            if not path:
+                continue
+            try:
+                mtime_ns = path.stat().st_mtime_ns
+            except OSError:
+                continue
+
+            try:
+                vvmviz_config = _read_config_table(str(path), mtime_ns)
+
+                # Create instance with loaded values
+                return cls(
+                    default_vvm_dir=vvmviz_config.get('default_vvm_dir', cls.default_vvm_dir),
+                    county_shapefile=Path(vvmviz_config.get('county_shapefile', cls.county_shapefile)),
+                    town_shapefile=Path(vvmviz_config.get('town_shapefile', cls.town_shapefile)),
+                    max_frame_cache_size=vvmviz_config.get('max_frame_cache_size', cls.max_frame_cache_size),
+                    frame_cache_bytes=vvmviz_config.get('frame_cache_bytes', cls.frame_cache_bytes),
+                    frame_cache_policy=vvmviz_config.get('frame_cache_policy', cls.frame_cache_policy),
+                    cache_dtype=vvmviz_config.get('cache_dtype', cls.cache_dtype),
+                    dataset_cache_size=vvmviz_config.get('dataset_cache_size', cls.dataset_cache_size),
+                    dataset_cache_bytes=vvmviz_config.get('dataset_cache_bytes', cls.dataset_cache_bytes),
+                    prefetch_window=vvmviz_config.get('prefetch_window', cls.prefetch_window),
+                    fast_image=vvmviz_config.get('fast_image', cls.fast_image),
+                    num_procs=vvmviz_config.get('num_procs', cls.num_procs),
+                    num_compute_threads=vvmviz_config.get('num_compute_threads', cls.num_compute_threads),
+                    io_workers=vvmviz_config.get('io_workers', cls.io_workers),
+                    notifications=vvmviz_config.get('notifications', cls.notifications),
+                    default_colormap=vvmviz_config.get('default_colormap', cls.default_colormap),
+                )
+            except Exception as e:
+                logger.warning(f"Failed to load config from {path}: {e}")
+                # Fall through to use defaults
 
         # No config file found or loading failed, use defaults
         return cls()
 
+    def with_env_overrides(self) -> 'VVMVizConfig':
+        """
+        Return a copy with VVMVIZ_* environment variables applied.
+
+        See _ENV_OVERRIDES for the variables (e.g. VVMVIZ_IO_WORKERS=4).
+        Invalid values are logged and ignored.
+        """
+        changes = {}
+        for var, (field, parse) in _ENV_OVERRIDES.items():
+            value = os.environ.get(var)
+            if value is None:
+                continue
+            try:
+                changes[field] = parse(value)
+            except ValueError:
+                logger.warning(f"Ignoring invalid {var}={value!r}")
+        return replace(self, **changes) if changes else self
+
 
 # =============================================================================
 # Global Config Instance
 # =============================================================================
 
-# Default configuration instance (can be overridden by loading from file)
-config = VVMVizConfig()
+# Configuration instance: config.toml (./ or ~/.vvmviz/) if present, then
+# VVMVIZ_* environment overrides
+config = VVMVizConfig.load_from_file().with_env_overrides()
@@ -16,41 +16,74 @@ This design improves:
 """
 
 import os
+import queue
 import logging
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, deque
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 import numpy as np
 import panel as pn
 import holoviews as hv
 
-from vvmviz.config import FILE_IO_LOCK
-from vvmviz.state import AppState, range_stream, create_range_recorder
+from vvmviz.config import (
+    config,
+    PREVIEW_FACTOR,
+    PREVIEW_MIN_SIZE,
+    PREVIEW_REFINE_DELAY_MS,
+    UPDATE_MIN_INTERVAL_MS,
+    RANGE_DEBOUNCE_MS,
+    NOTIFY_BATCH_MS,
+    COLUMN_INTEGRATED_VARS,
+)
+from vvmviz.state import AppState, create_range_recorder
 from vvmviz.core.data_loader import (
     list_simulations,
-    scan_variable_groups,
-    scan_time_indices,
-    get_vertical_info,
-    get_coordinate_info
+    SimMeta,
+    scan_simulation
 )
 from vvmviz.core.data_processor import (
+    FrameBundle,
     load_frame_bundle,
     squeeze_singleton_dims,
     get_data_array
 )
-from vvmviz.plotting.base import create_main_plot, calculate_color_limits
+from vvmviz.plotting.base import create_main_plot, calculate_color_limits, nan_minmax, coord_extent
 from vvmviz.plotting.overlays import (
     create_wind_vectors,
     create_contour_overlay,
     get_county_boundaries,
-    get_town_boundaries
+    get_town_boundaries,
+    wind_speed_direction
 )
 from vvmviz.plotting.colormaps import get_variable_default, DEFAULT_COLORMAP
 from vvmviz.utils.cache import get_cache_manager, FrameRequest
+from vvmviz.utils.io_pool import run_in_pool
+from vvmviz.utils.throttle import AdaptiveThrottle
 from vvmviz.utils.metadata import build_metadata_markdown, format_time_value
 from vvmviz.ui import DomainMapSelector
 
 logger = logging.getLogger(__name__)
 
+# Number of contour frames whose auto limits are remembered
+CONTOUR_RANGE_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=256)
+def _title_header(var_name: str, long_name: str, units: str, c_title: str) -> str:
+    """Title lines that stay fixed while scrubbing time (variable, contour)."""
+    long_name = long_name[0].upper() + long_name[1:] if long_name else var_name
+
+    header = long_name
+    if units and units != 'N/A':
+        header += f" [{units}]"
+    if c_title:
+        header += f"\n{c_title}"
+    return header
+
 
 class VVMVizController:
     """
@@ -70,6 +103,10 @@ class VVMVizController:
         The pane for displaying metadata
     map_selector : DomainMapSelector
         The interactive domain map selector
+    min_interval_ms : float, optional
+        Minimum interval between widget-triggered plot updates
+        (default: UPDATE_MIN_INTERVAL_MS); raised to the measured render
+        time when rendering is slower
 
     Attributes
     ----------
@@ -106,7 +143,8 @@ class VVMVizController:
         widgets: Dict[str, Any],
         plot_pane: pn.pane.HoloViews,
         metadata_pane: pn.pane.Markdown,
-        map_selector: DomainMapSelector
+        map_selector: DomainMapSelector,
+        min_interval_ms: float = UPDATE_MIN_INTERVAL_MS
     ):
         # Core references
         self.widgets = widgets
@@ -118,12 +156,95 @@ class VVMVizController:
         self.state = AppState()
         self.cache = get_cache_manager()
 
-        # Setup range tracking
+        # Setup range tracking: the session's own RangeXY stream pushes
+        # zoom/pan ranges into state as soon as the view changes
+        self._range_stream = hv.streams.RangeXY()
         self._range_recorder = create_range_recorder(self.state)
-        range_stream.add_subscriber(self._range_recorder)
+        self._range_stream.add_subscriber(self._range_recorder)
+
+        # The wind overlay follows its own stream, fed from the range stream
+        # at most once per RANGE_DEBOUNCE_MS, so panning does not rebuild
+        # the arrows for every intermediate range (linked=False: no browser
+        # callback of its own, only the throttled subscriber drives it)
+        self._wind_range_stream = hv.streams.RangeXY(linked=False)
+        self._range_stream.add_subscriber(
+            AdaptiveThrottle(self._wind_range_stream.event, RANGE_DEBOUNCE_MS)
+        )
+
+        # Background prefetch of upcoming frames: (distance, seq, generation,
+        # FrameRequest) items, nearest frame first; the backlog is bounded by
+        # the prefetch window and bumping the generation invalidates it
+        self._prefetch_queue: queue.PriorityQueue = queue.PriorityQueue(
+            maxsize=max(1, config.prefetch_window) + 1
+        )
+        self._prefetch_seq = itertools.count()
+        self._prefetch_generation = 0
+        self._prefetch_thread: Optional[threading.Thread] = None
+
+        # Progressive rendering: incremented per render so a pending
+        # full-resolution refine is skipped once a newer frame is shown
+        self._render_token = 0
+
+        # Widget events reach update_plot through an adaptive throttle
+        self._throttled_update = AdaptiveThrottle(self.update_plot, min_interval_ms)
+
+        # Widgets the rendered plot depends on (set in attach_callbacks) and
+        # the fingerprint of the last completed render
+        self._render_widgets: list = []
+        self._last_fingerprint: Optional[tuple] = None
+
+        # Auto contour limits per contour frame, so UI-only updates (cmap,
+        # toggles) skip the reduction; bounded LRU
+        self._contour_range_cache: 'OrderedDict[tuple, tuple]' = OrderedDict()
+
+        # (key, title) of the last plot title; colormap/clim updates reuse it
+        self._title_cache: Optional[tuple] = None
+
+        # Pending (level, message) notifications, flushed in batches
+        self._notify_queue: deque = deque()
+        self._notify_lock = threading.Lock()
+        self._notify_scheduled = False
 
         logger.info("VVMVizController initialized")
 
+    def _notify(self, level: str, message: str):
+        """
+        Queue a toast notification (no-op when notifications are disabled).
+
+        Notifications are flushed NOTIFY_BATCH_MS after the first one is
+        queued, so a burst of failures sends a few messages to the browser
+        instead of one per error.
+        """
+        if not (config.notifications and pn.state.notifications):
+            return
+
+        if pn.state.curdoc is None:
+            getattr(pn.state.notifications, level)(message)
+            return
+
+        with self._notify_lock:
+            self._notify_queue.append((level, message))
+            if self._notify_scheduled:
+                return
+            self._notify_scheduled = True
+
+        pn.state.add_periodic_callback(
+            self._drain_notifications, period=NOTIFY_BATCH_MS, count=1
+        )
+
+    def _drain_notifications(self):
+        """Show queued notifications, merging consecutive repeats."""
+        with self._notify_lock:
+            pending = list(self._notify_queue)
+            self._notify_queue.clear()
+            self._notify_scheduled = False
+
+        for (level, message), group in itertools.groupby(pending):
+            count = sum(1 for _ in group)
+            if count > 1:
+                message = f"{message} (\u00d7{count})"
+            getattr(pn.state.notifications, level)(message)
+
     # =========================================================================
     # Simulation Management
     # =========================================================================
@@ -139,8 +260,7 @@ class VVMVizController:
         path = self.widgets['path_input'].value
 
         if not os.path.isdir(path):
-            if pn.state.notifications:
-                pn.state.notifications.error(f"Invalid directory: {path}")
+            self._notify('error', f"Invalid directory: {path}")
             logger.error(f"Invalid directory: {path}")
             return
 
@@ -148,8 +268,7 @@ class VVMVizController:
             sims = list_simulations(path)
 
             if not sims:
-                if pn.state.notifications:
-                    pn.state.notifications.warning(f"No simulations found in {path}")
+                self._notify('warning', f"No simulations found in {path}")
                 logger.warning(f"No simulations found in {path}")
                 self.widgets['sim_selector'].options = {}
                 self.widgets['sim_selector'].value = None
@@ -158,15 +277,13 @@ class VVMVizController:
             # Update simulation selector
             new_options = {p.name: str(p) for p in sims}
             self.widgets['sim_selector'].options = new_options
-            self.widgets['sim_selector'].value = list(new_options.values())[0]
+            self.widgets['sim_selector'].value = next(iter(new_options.values()))
 
-            if pn.state.notifications:
-                pn.state.notifications.success(f"Loaded {len(sims)} simulations.")
+            self._notify('success', f"Loaded {len(sims)} simulations.")
             logger.info(f"Loaded {len(sims)} simulations from {path}")
 
         except Exception as e:
-            if pn.state.notifications:
-                pn.state.notifications.error(f"Error loading simulations: {e}")
+            self._notify('error', f"Error loading simulations: {e}")
             logger.error(f"Error loading simulations: {e}", exc_info=True)
 
     def on_simulation_change(self, event):
@@ -191,8 +308,10 @@ class VVMVizController:
             self.state.is_loading_simulation = True
             logger.info(f"Loading simulation: {sim_path}")
 
-            # Scan variable groups
-            groups = scan_variable_groups(sim_path)
+            # One fused metadata scan (memoized per process until archive/ changes)
+            meta = scan_simulation(sim_path)
+            groups = meta.variable_groups
+            self.state.sim_meta = meta
             self.state.variable_groups = groups
             self.state.current_sim_path = sim_path
 
@@ -200,7 +319,7 @@ class VVMVizController:
             self._update_variable_selectors(groups)
 
             # Update range sliders
-            self._update_range_sliders(sim_path)
+            self._update_range_sliders(meta)
 
             # Update domain map
             self.map_selector.create_terrain_map(sim_path)
@@ -208,8 +327,7 @@ class VVMVizController:
             logger.info(f"Simulation loaded: {len(groups)} variable groups found")
 
         except Exception as e:
-            if pn.state.notifications:
-                pn.state.notifications.error(f"Error loading simulation: {e}")
+            self._notify('error', f"Error loading simulation: {e}")
             logger.error(f"Error loading simulation: {e}", exc_info=True)
         finally:
             self.state.is_loading_simulation = False
@@ -242,11 +360,12 @@ class VVMVizController:
                 if category_options:
                     self.widgets['var_selectors']['contour_category'].value = category_options[0]
 
-    def _update_range_sliders(self, sim_path: str):
+    def _update_range_sliders(self, meta: SimMeta):
         """Update time, height, and spatial range sliders for new simulation."""
         # 1. Time
-        available_t_indices = scan_time_indices(sim_path)
+        available_t_indices = meta.time_indices
         self.state.available_time_indices = available_t_indices
+        self.state.time_index_array = np.asarray(available_t_indices, dtype=np.int64)
 
         t_min = available_t_indices[0] if available_t_indices else 0
         t_max = available_t_indices[-1] if available_t_indices else 0
@@ -255,7 +374,7 @@ class VVMVizController:
         self.widgets['range']['time'].value = (t_min, t_max)
 
         # 2. Vertical (Height)
-        z_info = get_vertical_info(sim_path)
+        z_info = meta.vertical
         if z_info and 'height_range' in z_info:
             z_min, z_max = z_info['height_range']
             if z_max <= z_min:
@@ -272,7 +391,7 @@ class VVMVizController:
                 logger.debug(f"Reset lev_slider to {first_level}m for new simulation")
 
         # 3. Horizontal (X, Y)
-        coord_info = get_coordinate_info(sim_path)
+        coord_info = meta.coords
         if coord_info:
             nx = coord_info.get('nx', 100)
             ny = coord_info.get('ny', 100)
@@ -349,15 +468,9 @@ class VVMVizController:
         sim_path = self.state.current_sim_path
 
         if not var_name or not sim_path:
-            if pn.state.notifications:
-                pn.state.notifications.warning("Please select a simulation and variable")
+            self._notify('warning', "Please select a simulation and variable")
             return
 
-        # Initialize defaults
-        target_cmap = DEFAULT_COLORMAP
-        target_reverse = False
-        target_symmetric = False
-
         try:
             self.state.is_loading_simulation = True
             logger.info(f"Loading data: {var_name} from {sim_path}")
@@ -378,19 +491,19 @@ class VVMVizController:
             sample_t = self._get_first_available_time(t_range_full)
             sample_t_range = (sample_t, sample_t)
 
-            with FILE_IO_LOCK:
-                da_sample = get_data_array(
-                    sim_path, var_name,
-                    t_range=sample_t_range,
-                    z_range=z_range_full,
-                    x_range=x_range,
-                    y_range=y_range,
-                    use_cache=False
-                )
+            # get_data_array locks only the file open itself; xarray decoding
+            # and lazy assembly run unlocked
+            da_sample = get_data_array(
+                sim_path, var_name,
+                t_range=sample_t_range,
+                z_range=z_range_full,
+                x_range=x_range,
+                y_range=y_range,
+                use_cache=False
+            )
 
             if da_sample is None:
-                if pn.state.notifications:
-                    pn.state.notifications.error(f"Failed to load variable: {var_name}")
+                self._notify('error', f"Failed to load variable: {var_name}")
                 return
 
             # Check coordinate bounds changes
@@ -405,14 +518,11 @@ class VVMVizController:
 
             # Apply variable defaults
             defaults = get_variable_default(var_name) or {}
-            target_cmap = defaults.get('cmap', DEFAULT_COLORMAP)
-            target_reverse = defaults.get('reverse', False)
-            target_symmetric = defaults.get('symmetric', False)
-
-            self.widgets['cmap_selector'].value = target_cmap
-            self.widgets['cmap_reverse'].value = target_reverse
-            self.widgets['clim']['symmetric'].value = target_symmetric
-            self.widgets['clim']['lock'].value = False
+            self._apply_preset(
+                cmap=defaults.get('cmap', DEFAULT_COLORMAP),
+                reverse=defaults.get('reverse', False),
+                symmetric=defaults.get('symmetric', False)
+            )
 
             logger.info(f"Data loaded successfully: {var_name}")
 
@@ -421,25 +531,46 @@ class VVMVizController:
 
         except Exception as e:
             logger.error(f"Error loading data: {e}", exc_info=True)
-            if pn.state.notifications:
-                pn.state.notifications.error(f"Data loading error: {e}")
+            self._notify('error', f"Data loading error: {e}")
         finally:
-            # Trigger plot update
+            # Trigger plot update; it covers any widget events still
+            # pending in the throttle
+            self._throttled_update.cancel()
             self.update_plot(force=True)
             self.state.skip_range_extraction = False
             self.state.is_loading_simulation = False
 
+    def _apply_preset(self, cmap: str, reverse: bool, symmetric: bool, lock: bool = False):
+        """
+        Set the colormap/clim widgets of a variable preset in one batch.
+
+        Browser updates are held until all widgets are set, and the plot
+        update events they trigger are left for the caller's single forced
+        render (see load_data).
+        """
+        with pn.io.hold():
+            self.widgets['cmap_selector'].value = cmap
+            self.widgets['cmap_reverse'].value = reverse
+            self.widgets['clim']['symmetric'].value = symmetric
+            self.widgets['clim']['lock'].value = lock
+
+    def _time_indices_in_range(self, t_range) -> np.ndarray:
+        """Available time indices within [t_start, t_end] (binary search)."""
+        t_arr = self.state.time_index_array
+        if t_arr is None:
+            return np.empty(0, dtype=np.int64)
+        lo = np.searchsorted(t_arr, t_range[0], side='left')
+        hi = np.searchsorted(t_arr, t_range[1], side='right')
+        return t_arr[lo:hi]
+
     def _get_first_available_time(self, t_range):
         """Get first available time index within range."""
-        all_available = self.state.available_time_indices
-        t_start, t_end = t_range
-
-        filtered = [i for i in all_available if t_start <= i <= t_end]
-        if filtered:
-            return filtered[0]
-        elif all_available:
-            return all_available[0]
-        return t_start
+        filtered = self._time_indices_in_range(t_range)
+        if filtered.size:
+            return int(filtered[0])
+        elif self.state.available_time_indices:
+            return self.state.available_time_indices[0]
+        return t_range[0]
 
     def _check_coordinate_bounds(self, da_sample):
         """Check and update coordinate bounds, reset ranges if changed."""
@@ -489,29 +620,25 @@ class VVMVizController:
             self._hide_time_controls()
             return
 
+        t_range = self.widgets['range']['time'].value
         all_available = self.state.available_time_indices
         if not all_available:
-            t_range = self.widgets['range']['time'].value
             all_available = list(range(int(t_range[1] - t_range[0] + 1)))
-
-        # Filter by time range
-        t_range = self.widgets['range']['time'].value
-        filtered_indices = [i for i in all_available if t_range[0] <= i <= t_range[1]]
+            filtered_indices = [i for i in all_available if t_range[0] <= i <= t_range[1]]
+        else:
+            # Filter by time range
+            filtered_indices = self._time_indices_in_range(t_range).tolist()
 
         if not filtered_indices:
             logger.warning(f"No time indices in range {t_range}, using all")
             filtered_indices = all_available
 
         # Build options
-        t_options = {}
-        self.state.time_index_map = {}
-
-        for slider_pos, actual_idx in enumerate(filtered_indices):
-            label = f"Step {actual_idx}"
-            t_options[label] = slider_pos
-            self.state.time_index_map[slider_pos] = actual_idx
-
-        self.widgets['time_controls']['slider'].options = t_options
+        self.state.time_index_map = dict(enumerate(filtered_indices))
+        self.widgets['time_controls']['slider'].options = {
+            f"Step {actual_idx}": slider_pos
+            for slider_pos, actual_idx in self.state.time_index_map.items()
+        }
 
         # Retain position if valid
         old_pos = self.widgets['time_controls']['slider'].value
@@ -527,6 +654,8 @@ class VVMVizController:
         """Setup level slider based on loaded data."""
         if 'lev' not in da_sample.dims:
             self.state.lev_vals = None
+            self.state.lev_sorted = None
+            self.state.lev_order = None
             self.state._reset_lev_slider = False
             self.widgets['lev_slider'].visible = False
             return
@@ -534,6 +663,11 @@ class VVMVizController:
         lev_vals = da_sample.coords['lev'].values
         self.state.lev_vals = lev_vals
 
+        # Sorted copy (+ positions in lev_vals) for per-render nearest-level search
+        order = np.argsort(lev_vals, kind='stable')
+        self.state.lev_order = order
+        self.state.lev_sorted = np.ascontiguousarray(lev_vals[order])
+
         lev_options = {f"{z:.0f} m": float(z) for z in lev_vals}
         self.widgets['lev_slider'].options = lev_options
 
@@ -552,6 +686,14 @@ class VVMVizController:
         self.state._reset_lev_slider = False
         self.widgets['lev_slider'].visible = True
 
+    def _nearest_level_index(self, z_val: float) -> int:
+        """Index into lev_vals of the level closest to z_val (binary search)."""
+        a = self.state.lev_sorted
+        pos = int(np.searchsorted(a, z_val))
+        if pos == len(a) or (pos > 0 and z_val - a[pos - 1] <= a[pos] - z_val):
+            pos -= 1
+        return int(self.state.lev_order[pos])
+
     def _show_time_controls(self):
         """Show all time control widgets."""
         self.widgets['time_controls']['slider'].visible = True
@@ -572,7 +714,7 @@ class VVMVizController:
     # Plot Update
     # =========================================================================
 
-    def update_plot(self, event=None, force=False):
+    def update_plot(self, event=None, force=False, refine=False):
         """
         Main plot update function.
 
@@ -585,6 +727,9 @@ class VVMVizController:
             The triggering event (if from a widget)
         force : bool, optional
             If True, force update even during loading
+        refine : bool, optional
+            If True, render at full resolution (used to replace a coarse
+            preview frame)
         """
         if not self.state.current_sim_path:
             return
@@ -596,21 +741,24 @@ class VVMVizController:
         try:
             pn.state.param.busy = True
 
-            # Extract ranges from Bokeh if not skipping
-            self._extract_bokeh_ranges()
-
             # Gather parameters from widgets
             params = self._gather_plot_params()
             if params is None:
                 return
 
+            # Skip events that do not change what would be rendered
+            fingerprint = self._render_fingerprint(params)
+            if not force and not refine and fingerprint == self._last_fingerprint:
+                logger.debug("Plot unchanged, skipping update")
+                return
+
             # Load data bundle
             bundle = self._load_data_bundle(params, force)
-            if bundle is None or 'main' not in bundle:
+            if bundle is None or bundle.main is None:
                 return
 
             # Process main variable
-            main_da = squeeze_singleton_dims(bundle['main'])
+            main_da = squeeze_singleton_dims(bundle.main)
 
             # Prefetch next frame
             self._prefetch_next_frame(params)
@@ -618,66 +766,123 @@ class VVMVizController:
             # Update clim if not locked
             self._update_clim_widgets(main_da)
 
-            # Build dataset with hover info
+            # Prepare overlays and hover layers
+            overlays, c_title, hover_vars = self._prepare_overlays(bundle, params)
+            hover_dims = list(hover_vars)
+
+            # Build dataset with hover info (hover layers merged in one update)
             main_ds = main_da.to_dataset()
             main_ds.attrs['main_var'] = params['var_name']
-            hover_dims = []
-
-            # Prepare overlays
-            overlays, c_title, hover_dims = self._prepare_overlays(bundle, params, main_ds, hover_dims)
+            if hover_vars:
+                main_ds.update(hover_vars)
 
             # Create title
             plot_title = self._build_plot_title(main_ds, params, c_title)
 
-            # Create base plot
-            base_plot = self._create_base_plot(main_ds, params, plot_title, hover_dims)
+            # Create base plot (coarse preview level first for large grids)
+            self._render_token += 1
+            preview_factor = 1 if refine else self._preview_factor(main_da)
+            base_plot = self._create_base_plot(
+                main_ds, params, plot_title, hover_dims, preview_factor
+            )
 
             # Attach range stream
             try:
-                range_stream.source = base_plot
+                self._range_stream.source = base_plot
             except Exception as e:
-                logger.warning(f"Failed to attach range_stream: {e}")
+                logger.warning(f"Failed to attach range stream: {e}")
 
             # Build final plot with overlays
             final_plot = self._compose_final_plot(base_plot, overlays, bundle, params)
 
-            # Update state and pane
+            # Build metadata
+            contour_da = squeeze_singleton_dims(bundle.contour) if bundle.contour is not None else None
+            metadata_key = (
+                params['sim_path'], params['var_name'], params['t_val'],
+                params['z_range'], params['x_range'], params['y_range'],
+                params['contour_var'] if contour_da is not None else None
+            )
+            metadata_md = build_metadata_markdown(
+                main_da, contour_da=contour_da, cache_key=metadata_key
+            )
+
+            # Update state and panes; hold sends the plot, range and
+            # metadata changes to the browser as one batch
             self.state.last_plot_object = final_plot
-            self.plot_pane.object = final_plot
+            with pn.io.hold():
+                self.plot_pane.object = final_plot
 
-            # Trigger initial range event
-            self._trigger_range_event()
+                # Trigger initial range event
+                self._trigger_range_event()
 
-            # Update metadata
-            contour_da = squeeze_singleton_dims(bundle['contour']) if 'contour' in bundle else None
-            self.metadata_pane.object = build_metadata_markdown(main_da, contour_da=contour_da)
+                # Metadata is unchanged on refines and style-only updates
+                if self.metadata_pane.object != metadata_md:
+                    self.metadata_pane.object = metadata_md
+
+            # Taken after rendering: the render itself sets widgets (auto
+            # clim, auto contour range), and the throttled events those
+            # changes queued must not trigger a second identical render
+            self._last_fingerprint = self._render_fingerprint(params)
+
+            if preview_factor > 1:
+                self._schedule_refine()
 
         except Exception as e:
             logger.error(f"Error updating plot: {e}", exc_info=True)
-            if pn.state.notifications:
-                pn.state.notifications.error(f"Plot error: {e}")
+            self._notify('error', f"Plot error: {e}")
         finally:
             pn.state.param.busy = False
 
-    def _extract_bokeh_ranges(self):
-        """Extract current ranges from Bokeh plot model."""
-        if self.state.skip_range_extraction:
-            logger.info("[ZOOM] Skipping range extraction (reset in progress)")
-            return
+    def _render_fingerprint(self, params: Dict[str, Any]) -> tuple:
+        """Summary of everything the rendered plot depends on (compared by equality)."""
+        return (
+            tuple(params.items()),
+            tuple(widget.value for widget in self._render_widgets),
+            self.state.saved_x_range,
+            self.state.saved_y_range,
+        )
+
+    def _preview_factor(self, main_da) -> int:
+        """
+        Choose the pyramid level to paint first.
+
+        The coarse level is only used on the fast_image path (Datashader
+        already aggregates to the viewport) for large grids, and only when
+        the view is not zoomed in to less than 1/PREVIEW_FACTOR of the
+        domain width (where the coarse level would look blocky).
+        """
+        if not config.fast_image or main_da.size < PREVIEW_MIN_SIZE:
+            return 1
 
         try:
-            if hasattr(self.plot_pane, '_models') and self.plot_pane._models:
-                bokeh_model = list(self.plot_pane._models.values())[0][0]
-                if hasattr(bokeh_model, 'x_range') and hasattr(bokeh_model, 'y_range'):
-                    current_x = (bokeh_model.x_range.start, bokeh_model.x_range.end)
-                    current_y = (bokeh_model.y_range.start, bokeh_model.y_range.end)
-
-                    if all(v is not None for v in current_x):
-                        self.state.saved_x_range = current_x
-                    if all(v is not None for v in current_y):
-                        self.state.saved_y_range = current_y
+            lon_dim = 'lon' if 'lon' in main_da.dims else main_da.dims[-1]
+            lon = main_da[lon_dim].values
+            x_range = self.state.saved_x_range
+            if x_range is not None and len(lon) > 1:
+                extent = abs(float(lon[-1]) - float(lon[0]))
+                visible = abs(x_range[1] - x_range[0])
+                if extent > 0 and visible / extent < 1.0 / PREVIEW_FACTOR:
+                    return 1
         except Exception as e:
-            logger.debug(f"Could not extract ranges from Bokeh: {e}")
+            logger.debug(f"Could not determine preview level: {e}")
+            return 1
+
+        return PREVIEW_FACTOR
+
+    def _schedule_refine(self):
+        """Re-render the current frame at full resolution after a short delay."""
+        token = self._render_token
+
+        def _refine():
+            # Skip if another frame was rendered meanwhile (e.g. playback)
+            if token == self._render_token:
+                self.update_plot(refine=True)
+
+        if pn.state.curdoc is None:
+            _refine()
+            return
+
+        pn.state.add_periodic_callback(_refine, period=PREVIEW_REFINE_DELAY_MS, count=1)
 
     def _gather_plot_params(self) -> Optional[Dict[str, Any]]:
         """Gather all plot parameters from widgets."""
@@ -693,14 +898,14 @@ class VVMVizController:
         z_val = self.widgets['lev_slider'].value
 
         # Determine z_range
-        if var_name in ['cwv', 'iwp', 'lwp']:
-            z_info = get_vertical_info(self.state.current_sim_path)
+        if var_name in COLUMN_INTEGRATED_VARS:
+            z_info = self.state.sim_meta.vertical if self.state.sim_meta else None
             if z_info and 'height_range' in z_info:
                 z_range = tuple(z_info['height_range'])
             else:
                 z_range = tuple(self.widgets['range']['lev'].value)
         elif self.state.lev_vals is not None and len(self.state.lev_vals) > 0 and self.widgets['lev_slider'].visible:
-            idx = int((np.abs(self.state.lev_vals - z_val)).argmin())
+            idx = self._nearest_level_index(z_val)
             z_range = ('index', idx, idx)
         else:
             z_range = None
@@ -727,81 +932,173 @@ class VVMVizController:
             'symmetric_clim': self.widgets['clim']['symmetric'].value,
         }
 
+    def _frame_request(self, params: Dict[str, Any], t_val: int) -> FrameRequest:
+        """Build the FrameRequest for a time index with the current settings."""
+        return FrameRequest(
+            sim_path=params['sim_path'],
+            var_name=params['var_name'],
+            t_range=(t_val, t_val),
+            z_range=params['z_range'],
+            x_range=params['x_range'],
+            y_range=params['y_range'],
+            wind_enabled=params['wind_enabled'],
+            use_surface=params['use_surface_wind'],
+            contour_enabled=params['contour_enabled'],
+            contour_var=params['contour_var']
+        )
+
+    @staticmethod
+    def _load_request(req: FrameRequest) -> FrameBundle:
+        """Load (and compute) the frame bundle for a request."""
+        # Runs in the I/O process pool when config.io_workers > 0
+        return run_in_pool(
+            load_frame_bundle,
+            sim_path=req.sim_path,
+            main_var=req.var_name,
+            t_range=req.t_range,
+            z_range=req.z_range,
+            x_range=req.x_range,
+            y_range=req.y_range,
+            wind_enabled=req.wind_enabled,
+            use_surface_wind=req.use_surface,
+            contour_enabled=req.contour_enabled,
+            contour_var=req.contour_var,
+            use_cache=True,
+            compute=True
+        )
+
     def _load_data_bundle(self, params: Dict[str, Any], force: bool = False):
         """Load data bundle from cache or file."""
-        cache_key = (
-            params['var_name'],
-            (params['t_val'], params['t_val']),
-            params['z_range'],
-            params['wind_enabled'],
-            params['contour_enabled'],
-            params['contour_var']
-        )
+        req = self._frame_request(params, params['t_val'])
+        cache_key = req.cache_key()
 
-        bundle = self.cache.get(cache_key)
-
-        if bundle is None or force:
-            bundle = load_frame_bundle(
-                sim_path=params['sim_path'],
-                main_var=params['var_name'],
-                t_range=(params['t_val'], params['t_val']),
-                z_range=params['z_range'],
-                x_range=params['x_range'],
-                y_range=params['y_range'],
-                wind_enabled=params['wind_enabled'],
-                use_surface_wind=params['use_surface_wind'],
-                contour_enabled=params['contour_enabled'],
-                contour_var=params['contour_var'],
-                use_cache=True,
-                compute=True
-            )
-            self.cache.put(cache_key, bundle)
+        if force:
+            bundle = self.cache.put(cache_key, self._load_request(req))
+        else:
+            # Waits for the prefetcher if it is already loading this frame
+            bundle = self.cache.get_or_load(cache_key, lambda: self._load_request(req))
+
+        # Cached frames may be stored at reduced precision; render in float32
+        if bundle.main is not None and bundle.main.dtype == np.float16:
+            bundle = bundle.astype(np.float32)
 
         return bundle
 
     def _prefetch_next_frame(self, params: Dict[str, Any]):
-        """Prefetch next time frame asynchronously."""
+        """Queue the next prefetch_window time frames for background loading."""
         if not self.widgets['time_controls']['slider'].visible:
             return
 
         try:
-            t_options = list(self.widgets['time_controls']['slider'].options.values())
+            # Slider values are positions 0..n-1 (see _setup_time_slider)
+            n_options = len(self.state.time_index_map)
             current_idx = self.widgets['time_controls']['slider'].value
 
-            if current_idx in t_options:
-                idx_pos = t_options.index(current_idx)
-                if idx_pos < len(t_options) - 1:
-                    next_pos = t_options[idx_pos + 1]
-                    next_t = self.state.time_index_map.get(next_pos, next_pos)
-
-                    req = FrameRequest(
-                        sim_path=params['sim_path'],
-                        var_name=params['var_name'],
-                        t_range=(next_t, next_t),
-                        z_range=params['z_range'],
-                        x_range=params['x_range'],
-                        y_range=params['y_range'],
-                        wind_enabled=params['wind_enabled'],
-                        use_surface=params['use_surface_wind'],
-                        contour_enabled=params['contour_enabled'],
-                        contour_var=params['contour_var']
-                    )
-
-                    def _loader(r):
-                        return load_frame_bundle(
-                            r.sim_path, r.var_name, r.t_range, r.z_range,
-                            r.x_range, r.y_range,
-                            wind_enabled=r.wind_enabled,
-                            use_surface_wind=r.use_surface,
-                            contour_enabled=r.contour_enabled,
-                            contour_var=r.contour_var,
-                            use_cache=True, compute=True
-                        )
-
-                    self.cache.prefetch_async(req, _loader)
+            # Invalidate frames queued for the previous position
+            self._prefetch_generation += 1
+            generation = self._prefetch_generation
+            self._drain_prefetch_queue()
+
+            if not isinstance(current_idx, int) or not 0 <= current_idx < n_options:
+                return
+
+            upcoming = range(current_idx + 1, min(current_idx + 1 + config.prefetch_window, n_options))
+
+            for distance, next_pos in enumerate(upcoming, start=1):
+                next_t = self.state.time_index_map.get(next_pos, next_pos)
+                item = (distance, next(self._prefetch_seq), generation,
+                        self._frame_request(params, next_t))
+                try:
+                    self._prefetch_queue.put_nowait(item)
+                except queue.Full:
+                    break  # Worker is behind; farther frames can wait
+
         except Exception as e:
             logger.debug(f"Prefetch failed: {e}")
 
+    def _drain_prefetch_queue(self):
+        """Drop all queued prefetch requests."""
+        try:
+            while True:
+                self._prefetch_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _prefetch_loop(self):
+        """
+        Background worker loading queued frames into the frame cache.
+
+        With an I/O process pool, up to config.io_workers queued frames are
+        taken at once and read concurrently by the pool's processes; without
+        one, reads are serialized by the HDF5 lock and frames load one by one.
+        """
+        batch_size = max(1, config.io_workers)
+        executor = ThreadPoolExecutor(
+            max_workers=batch_size, thread_name_prefix="vvmviz_prefetch_io"
+        ) if batch_size > 1 else None
+
+        try:
+            while True:
+                batch = [self._prefetch_queue.get()]
+                while len(batch) < batch_size:
+                    try:
+                        batch.append(self._prefetch_queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                stop = any(req is None for *_, req in batch)
+                # Skip stale requests (the time slider moved on) and cached frames
+                reqs = [
+                    req for _, _, generation, req in batch
+                    if req is not None
+                    and generation == self._prefetch_generation
+                    and not self.cache.contains(req.cache_key())
+                ]
+
+                if executor is not None and len(reqs) > 1:
+                    list(executor.map(self._prefetch_one, reqs))
+                else:
+                    for req in reqs:
+                        self._prefetch_one(req)
+
+                if stop:
+                    return
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def _prefetch_one(self, req: FrameRequest):
+        """Load one frame into the cache (skipped if it is already loading)."""
+        try:
+            # Frames already being loaded (e.g. by the render) are skipped
+            if self.cache.get_or_load(req.cache_key(), lambda: self._load_request(req), wait=False) is not None:
+                logger.debug(f"Prefetched {req.var_name} t={req.t_range}")
+        except Exception as e:
+            logger.debug(f"Prefetch failed for t={req.t_range}: {e}")
+
+    def _start_prefetcher(self):
+        """Start the prefetch worker thread (stopped when the session ends)."""
+        if self._prefetch_thread is not None:
+            return
+
+        self._prefetch_thread = threading.Thread(
+            target=self._prefetch_loop,
+            name="vvmviz_prefetch_loop",
+            daemon=True
+        )
+        self._prefetch_thread.start()
+
+        if pn.state.curdoc is not None:
+            pn.state.on_session_destroyed(lambda session_context: self._stop_prefetcher())
+
+    def _stop_prefetcher(self):
+        """Stop the prefetch worker thread."""
+        self._prefetch_generation += 1
+        self._drain_prefetch_queue()
+        # Stop sentinel sorts ahead of any frame
+        self._prefetch_queue.put((0, next(self._prefetch_seq), self._prefetch_generation, None))
+        self._prefetch_thread = None
+
     def _update_clim_widgets(self, main_da):
         """Update color limit widgets from data if not locked."""
         if self.widgets['clim']['lock'].value:
@@ -822,9 +1119,10 @@ class VVMVizController:
         except Exception as e:
             logger.warning(f"Failed to update clim widgets: {e}")
 
-    def _prepare_overlays(self, bundle, params, main_ds, hover_dims):
-        """Prepare all overlay layers."""
+    def _prepare_overlays(self, bundle, params):
+        """Prepare all overlay layers and the extra hover layers (name -> DataArray)."""
         overlays = []
+        hover_vars = {}
         c_title = ""
 
         # Boundaries
@@ -834,50 +1132,55 @@ class VVMVizController:
             overlays.append(get_town_boundaries())
 
         # Wind
-        if 'wind' in bundle:
-            hover_dims = self._process_wind_data(bundle, main_ds, hover_dims)
+        if bundle.wind is not None:
+            self._process_wind_data(bundle, hover_vars)
 
         # Contours
-        if 'contour' in bundle:
-            c_title, hover_dims = self._process_contour_data(bundle, main_ds, hover_dims, overlays)
+        if bundle.contour is not None:
+            c_title = self._process_contour_data(bundle, params, hover_vars, overlays)
 
-        return overlays, c_title, hover_dims
+        return overlays, c_title, hover_vars
 
-    def _process_wind_data(self, bundle, main_ds, hover_dims):
+    def _process_wind_data(self, bundle, hover_vars):
         """Process wind vector data for hover info."""
+        if not self.widgets['overlays']['wind_hover'].value:
+            return
+
         try:
-            u, v = bundle['wind']
+            u, v = bundle.wind
             u = squeeze_singleton_dims(u)
             v = squeeze_singleton_dims(v)
 
-            wspd = np.sqrt(u**2 + v**2)
-            angle_rad = np.arctan2(v, u)
-
-            if self.widgets['overlays']['wind_hover'].value:
-                wdir = (270 - angle_rad * 180 / np.pi) % 360
-                main_ds['wind speed (m s-1)'] = wspd
-                main_ds['wind direction (deg)'] = wdir
-                hover_dims.extend(['wind speed (m s-1)', 'wind direction (deg)'])
+            wspd, wdir = wind_speed_direction(np.asarray(u.values), np.asarray(v.values))
+            hover_vars['wind speed (m s-1)'] = u.copy(data=wspd)
+            hover_vars['wind direction (deg)'] = u.copy(data=wdir)
 
         except Exception as e:
             logger.warning(f"Failed to process wind data: {e}")
 
-        return hover_dims
-
-    def _process_contour_data(self, bundle, main_ds, hover_dims, overlays):
+    def _process_contour_data(self, bundle, params, hover_vars, overlays):
         """Process contour overlay data."""
         c_title = ""
         try:
-            c_da = squeeze_singleton_dims(bundle['contour'])
+            c_da = squeeze_singleton_dims(bundle.contour)
+
+            # Name and units shared by the title and the hover label
+            c_name = self.widgets['var_selectors']['contour_variable'].value
+            c_long_name = c_da.attrs.get('long_name', c_name)
+            c_units = c_da.attrs.get('units', '')
+            has_units = bool(c_units) and c_units != 'N/A'
 
             if self.widgets['overlays']['contour'].value:
                 # Determine contour range
                 if self.state.auto_contour_range:
                     c_vmin, c_vmax = None, None
+                    # All-NaN frames keep the old values
+                    data_min, data_max = self._contour_range(c_da, params)
                     try:
                         self.state.updating_contour_programmatically = True
-                        self.widgets['overlays']['contour_vmin'].value = float(c_da.min())
-                        self.widgets['overlays']['contour_vmax'].value = float(c_da.max())
+                        if not np.isnan(data_min):
+                            self.widgets['overlays']['contour_vmin'].value = data_min
+                            self.widgets['overlays']['contour_vmax'].value = data_max
                     finally:
                         self.state.updating_contour_programmatically = False
                 else:
@@ -885,14 +1188,7 @@ class VVMVizController:
                     c_vmax = self.widgets['overlays']['contour_vmax'].value
 
                 # Build title
-                c_name = self.widgets['var_selectors']['contour_variable'].value
-                c_long_name = c_da.attrs.get('long_name', c_name)
-                c_units = c_da.attrs.get('units', '')
-
-                if c_units and c_units != 'N/A':
-                    c_title = f"Contour: {c_long_name} [{c_units}]"
-                else:
-                    c_title = f"Contour: {c_long_name}"
+                c_title = f"Contour: {c_long_name} [{c_units}]" if has_units else f"Contour: {c_long_name}"
 
                 # Create overlay
                 contour_overlay = create_contour_overlay(
@@ -906,31 +1202,54 @@ class VVMVizController:
 
             # Hover info
             if self.widgets['overlays']['contour_hover'].value:
-                c_name = self.widgets['var_selectors']['contour_variable'].value
-                c_long_name = c_da.attrs.get('long_name', c_name)
-                c_units = c_da.attrs.get('units', '')
-
-                if c_units and c_units != 'N/A':
-                    c_hover_name = f"{c_long_name} ({c_units})"
-                else:
-                    c_hover_name = c_long_name
-
-                main_ds[c_hover_name] = c_da
-                hover_dims.append(c_hover_name)
+                c_hover_name = f"{c_long_name} ({c_units})" if has_units else c_long_name
+                hover_vars[c_hover_name] = c_da
 
         except Exception as e:
             logger.warning(f"Failed to process contour data: {e}")
 
-        return c_title, hover_dims
+        return c_title
+
+    def _contour_range(self, c_da, params: Dict[str, Any]) -> tuple:
+        """Data (min, max) of the contour frame, memoized per frame."""
+        key = (
+            params['sim_path'], params['contour_var'], params['t_val'],
+            params['z_range'], params['x_range'], params['y_range']
+        )
+        limits = self._contour_range_cache.get(key)
+        if limits is not None:
+            self._contour_range_cache.move_to_end(key)
+            return limits
+
+        limits = nan_minmax(c_da.values)
+        self._contour_range_cache[key] = limits
+        if len(self._contour_range_cache) > CONTOUR_RANGE_CACHE_SIZE:
+            self._contour_range_cache.popitem(last=False)
+        return limits
 
     def _build_plot_title(self, main_ds, params, c_title):
-        """Build multi-line plot title."""
-        var_name = params['var_name']
-        da = main_ds[var_name]
+        """Build multi-line plot title (reused while the frame is unchanged)."""
+        key = (
+            params['sim_path'], params['var_name'], params['t_val'],
+            params['z_range'], params['z_val'], c_title,
+            self.widgets['lev_slider'].visible
+        )
+        if self._title_cache is not None and self._title_cache[0] == key:
+            return self._title_cache[1]
+
+        title = self._format_plot_title(main_ds, params, c_title)
+        self._title_cache = (key, title)
+        return title
 
-        long_name = da.attrs.get('long_name', var_name)
-        long_name = long_name[0].upper() + long_name[1:] if long_name else var_name
-        units = da.attrs.get('units', '')
+    def _format_plot_title(self, main_ds, params, c_title):
+        var_name = params['var_name']
+        attrs = main_ds[var_name].attrs
+        header = _title_header(
+            var_name,
+            str(attrs.get('long_name', var_name)),
+            str(attrs.get('units', '')),
+            c_title
+        )
 
         # Format time
         if 'time' in main_ds.coords:
@@ -946,19 +1265,9 @@ class VVMVizController:
         elif params['z_val'] and self.widgets['lev_slider'].visible:
             z_info = f"  |  Height: {params['z_val']} m"
 
-        # Build title
-        title = f"{long_name}"
-        if units and units != 'N/A':
-            title += f" [{units}]"
-
-        if c_title:
-            title += f"\n{c_title}"
+        return f"{header}\nTime: {t_val_formatted}{z_info}"
 
-        title += f"\nTime: {t_val_formatted}{z_info}"
-
-        return title
-
-    def _create_base_plot(self, main_ds, params, title, hover_dims):
+    def _create_base_plot(self, main_ds, params, title, hover_dims, preview_factor=1):
         """Create the base plot without overlays."""
         return create_main_plot(
             main_ds,
@@ -973,7 +1282,9 @@ class VVMVizController:
             overlays=None,
             x_range=self.state.saved_x_range,
             y_range=self.state.saved_y_range,
-            hover_dims=hover_dims
+            hover_dims=hover_dims,
+            rasterize=not config.fast_image,
+            preview_factor=preview_factor
         )
 
     def _compose_final_plot(self, base_plot, overlays, bundle, params):
@@ -986,7 +1297,7 @@ class VVMVizController:
                 final_plot = final_plot * overlay
 
         # Add wind DynamicMap if enabled
-        if params['wind_enabled'] and 'wind' in bundle:
+        if params['wind_enabled'] and bundle.wind is not None:
             wind_dmap = self._create_wind_dmap(bundle)
             if wind_dmap is not None:
                 final_plot = final_plot * wind_dmap
@@ -997,15 +1308,15 @@ class VVMVizController:
     def _create_wind_dmap(self, bundle):
         """Create DynamicMap for wind vectors."""
         try:
-            u, v = bundle['wind']
+            u, v = bundle.wind
             u = squeeze_singleton_dims(u)
             v = squeeze_singleton_dims(v)
 
             lon_dim = 'lon' if 'lon' in u.dims else u.dims[-1]
             lat_dim = 'lat' if 'lat' in u.dims else u.dims[0]
 
-            base_x_range = (float(u[lon_dim].min()), float(u[lon_dim].max()))
-            base_y_range = (float(u[lat_dim].min()), float(u[lat_dim].max()))
+            base_x_range = coord_extent(u[lon_dim])
+            base_y_range = coord_extent(u[lat_dim])
 
             u_data = u
             v_data = v
@@ -1031,7 +1342,7 @@ class VVMVizController:
                 )
                 return result if result is not None else hv.VectorField([])
 
-            return hv.DynamicMap(quiver_callback, streams=[range_stream])
+            return hv.DynamicMap(quiver_callback, streams=[self._wind_range_stream])
 
         except Exception as e:
             logger.warning(f"Failed to create wind DynamicMap: {e}")
@@ -1041,7 +1352,7 @@ class VVMVizController:
         """Trigger initial range event for DynamicMap."""
         try:
             if self.state.saved_x_range is not None or self.state.saved_y_range is not None:
-                range_stream.event(
+                self._range_stream.event(
                     x_range=self.state.saved_x_range,
                     y_range=self.state.saved_y_range
                 )
@@ -1062,8 +1373,7 @@ class VVMVizController:
 
         self.state.skip_range_extraction = False
 
-        if pn.state.notifications:
-            pn.state.notifications.info("View reset")
+        self._notify('info', "View reset")
         logger.info("View reset")
 
     def reset_contour_range(self, event):
@@ -1071,8 +1381,7 @@ class VVMVizController:
         self.state.auto_contour_range = True
         self.widgets['overlays']['contour_levels'].param.trigger('value')
 
-        if pn.state.notifications:
-            pn.state.notifications.info("Contour range reset to auto")
+        self._notify('info', "Contour range reset to auto")
         logger.info("Contour range reset to auto")
 
     def on_contour_var_change(self, event):
@@ -1126,7 +1435,8 @@ class VVMVizController:
         ]
 
         for widget, param_name in update_triggers:
-            widget.param.watch(self.update_plot, param_name)
+            widget.param.watch(self._throttled_update, param_name)
+        self._render_widgets = [widget for widget, _ in update_triggers]
 
         # Load simulations button
         self.widgets['load_btn'].on_click(self.load_simulations)
@@ -1156,4 +1466,7 @@ class VVMVizController:
         self.widgets['overlays']['contour_vmin'].param.watch(self.on_contour_range_edit, 'value')
         self.widgets['overlays']['contour_vmax'].param.watch(self.on_contour_range_edit, 'value')
 
+        # Background frame prefetching
+        self._start_prefetcher()
+
         logger.info("All callbacks attached")
@@ -14,12 +14,15 @@ from vvmviz.core.data_loader import (
     get_vertical_info,
     get_terrain_info,
     scan_time_indices,
+    SimMeta,
+    scan_simulation,
 )
 
 from vvmviz.core.data_processor import (
     get_data_array,
     get_wind_vectors,
     get_contour_data,
+    FrameBundle,
     load_frame_bundle,
     squeeze_singleton_dims,
     select_single_time_level,
@@ -36,10 +39,13 @@ __all__ = [
     'get_vertical_info',
     'get_terrain_info',
     'scan_time_indices',
+    'SimMeta',
+    'scan_simulation',
     # Data Processing
     'get_data_array',
     'get_wind_vectors',
     'get_contour_data',
+    'FrameBundle',
     'load_frame_bundle',
     'squeeze_singleton_dims',
     'select_single_time_level',
@@ -8,32 +8,60 @@ Provides functions for accessing datasets, terrain data, and simulation metadata
 import os
 import re
 import logging
-from glob import glob
-from pathlib import Path
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from functools import lru_cache
-from typing import Dict, List, Tuple, Optional, Any
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Tuple, Optional, Any
+import netCDF4
 import xarray as xr
 
 import vvm_reader as vvm
 
 from vvmviz.config import (
-    FILE_IO_LOCK,
+    config,
+    get_file_lock,
+    HDF5_THREADSAFE,
     DEFAULT_VVM_DIR,
-    DATASET_CACHE_SIZE,
     TERRAIN_VAR_NAME,
+    COLUMN_INTEGRATED_VARS,
+    NC_CHUNK_CACHE_BYTES,
+    NC_CHUNK_CACHE_SLOTS,
+    DASK_CHUNK_BYTES,
 )
+from vvmviz.utils.sized_lru import sized_lru
 
 logger = logging.getLogger(__name__)
 
+# Enlarge the HDF5 chunk cache for files opened from here on (vvm_reader
+# opens through xarray's netCDF4 backend, which uses the library default)
+netCDF4.set_chunk_cache(NC_CHUNK_CACHE_BYTES, NC_CHUNK_CACHE_SLOTS)
+
 
 # =============================================================================
 # Simulation Discovery
 # =============================================================================
 
+# Concurrent directory probes when listing simulations (stat latency on
+# network filesystems dominates; local disks gain little beyond a few)
+LIST_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _is_simulation_dir(path: str) -> bool:
+    """Whether path looks like a VVM simulation (has an archive/ directory)."""
+    return os.path.isdir(os.path.join(path, 'archive'))
+
+
 def list_simulations(base_path: Path | str = DEFAULT_VVM_DIR) -> List[Path]:
     """
     List all available VVM simulations in a directory.
 
+    Subdirectories are probed for an ``archive/`` directory concurrently, so
+    directories holding many simulations on network storage list in a few
+    round trips instead of one per simulation.
+
     Parameters
     ----------
     base_path : Path or str
@@ -42,7 +70,7 @@ def list_simulations(base_path: Path | str = DEFAULT_VVM_DIR) -> List[Path]:
     Returns
     -------
     list of Path
-        List of simulation paths found
+        List of simulation paths found, sorted by name
 
     Examples
     --------
@@ -55,8 +83,16 @@ def list_simulations(base_path: Path | str = DEFAULT_VVM_DIR) -> List[Path]:
         return []
 
     try:
-        sims = vvm.list_available_simulations(str(base_path))
-        return sims
+        with os.scandir(base_path) as it:
+            candidates = sorted(
+                entry.path for entry in it
+                if entry.is_dir() and not entry.name.startswith('.')
+            )
+
+        with ThreadPoolExecutor(max_workers=LIST_MAX_WORKERS) as pool:
+            found = list(pool.map(_is_simulation_dir, candidates))
+
+        return [Path(p) for p, ok in zip(candidates, found) if ok]
     except Exception as e:
         logger.error(f"Error listing simulations in {base_path}: {e}")
         return []
@@ -66,6 +102,124 @@ def list_simulations(base_path: Path | str = DEFAULT_VVM_DIR) -> List[Path]:
 # Variable Group Scanning
 # =============================================================================
 
+# Variable names per file header: {(path, mtime_ns): names}, LRU order
+HEADER_CACHE_SIZE = 256
+_header_cache: 'OrderedDict[Tuple[str, int], FrozenSet[str]]' = OrderedDict()
+_header_cache_lock = threading.Lock()
+
+_COORD_VARS = frozenset(['xc', 'yc', 'zc', 'time', 'lon', 'lat', 'lev'])
+
+# Concurrent header reads during a directory scan. Only used with a
+# thread-safe HDF5 build: otherwise every open serializes on FILE_IO_LOCK
+# (see get_file_lock) and the pool just adds overhead
+SCAN_MAX_WORKERS = 8
+
+
+def _read_header_variables(sim_path: Path, fpath: str) -> FrozenSet[str]:
+    """
+    Read the data variable names from a NetCDF file header.
+
+    Opens the file with netCDF4 directly (no xarray decoding, no data
+    reads) and caches the result until the file's mtime changes.
+    """
+    key = (fpath, os.stat(fpath).st_mtime_ns)
+    with _header_cache_lock:
+        names = _header_cache.get(key)
+        if names is not None:
+            _header_cache.move_to_end(key)
+    if names is not None:
+        return names
+
+    with get_file_lock(sim_path):
+        with netCDF4.Dataset(fpath, 'r') as nc:
+            # Dimension coordinates are not data variables (as in xarray)
+            names = frozenset(v for v in nc.variables if v not in nc.dimensions)
+
+    with _header_cache_lock:
+        _header_cache[key] = names
+        while len(_header_cache) > HEADER_CACHE_SIZE:
+            _header_cache.popitem(last=False)
+    return names
+
+
+_GROUP_PATTERN = re.compile(r'\.([CL]\.[A-Za-z0-9]+)-')
+
+
+def _list_archive(sim_path: Path) -> Tuple[Dict[str, str], List[int]]:
+    """
+    List archive/ once, returning group files and time indices.
+
+    Returns
+    -------
+    tuple
+        ({group: path of its first initial-timestep file}, sorted unique
+        time indices)
+    """
+    archive_dir = sim_path / 'archive'
+    try:
+        with os.scandir(archive_dir) as it:
+            names = [entry.name for entry in it if entry.name.endswith('.nc')]
+    except OSError:
+        names = []
+
+    # Time index from the '-NNNNNN.nc' suffix; plain slicing, as archives
+    # hold thousands of files and only a few are initial-timestep files
+    indices = set()  # Use set to avoid duplicates from different variable files
+    initial = []
+    for fname in names:
+        step = fname[-9:-3]
+        if fname[-10:-9] != '-' or not step.isdigit():
+            continue
+        indices.add(int(step))
+        if step == '000000':
+            initial.append(fname)
+
+    # Group names come from the initial timestep files (e.g., '.L.Thermodynamic-');
+    # sorted so each group maps to the same file on every scan
+    group_map = {}
+    for fname in sorted(initial):
+        group_match = _GROUP_PATTERN.search(fname)
+        if group_match and group_match.group(1) not in group_map:
+            group_map[group_match.group(1)] = str(archive_dir / fname)
+
+    return group_map, sorted(indices)
+
+
+def _build_variable_groups(sim_path: Path, group_map: Dict[str, str]) -> Dict[str, List[str]]:
+    """Read the group file headers and assemble the variable menu."""
+    # Scan each group file for variables (headers only; in parallel when
+    # the HDF5 build allows concurrent opens)
+    def scan(fpath):
+        try:
+            return _read_header_variables(sim_path, fpath)
+        except Exception as e:
+            logger.warning(f"Could not read {fpath}: {e}")
+            return frozenset()
+
+    if HDF5_THREADSAFE and len(group_map) > 1:
+        with ThreadPoolExecutor(max_workers=min(SCAN_MAX_WORKERS, len(group_map))) as pool:
+            headers = list(pool.map(scan, group_map.values()))
+    else:
+        headers = [scan(fpath) for fpath in group_map.values()]
+
+    menu_dict = {}
+    for group, names in zip(group_map, headers):
+        vars_list = sorted(names - _COORD_VARS)
+        if vars_list:
+            menu_dict[f"File: {group}"] = vars_list
+
+    # Add diagnostic variables
+    try:
+        diag_vars = vvm.list_available_diagnostics()
+        if diag_vars:
+            menu_dict["Calc: Diagnostics"] = sorted(diag_vars)
+    except Exception as e:
+        logger.warning(f"Could not list diagnostics: {e}")
+
+    # Enrich with derived variables (e.g., Topography)
+    return enrich_variable_groups(menu_dict)
+
+
 def scan_variable_groups(sim_path: Path | str) -> Dict[str, List[str]]:
     """
     Scan a VVM simulation directory to identify available variable groups.
@@ -94,48 +248,8 @@ def scan_variable_groups(sim_path: Path | str) -> Dict[str, List[str]]:
 
     logger.info(f"Scanning simulation directory: {sim_path}")
 
-    # Find all initial timestep files (ending in -000000.nc)
-    archive_dir = sim_path / 'archive'
-    files = sorted(glob(str(archive_dir / "*-000000.nc")))
-
-    # Map group names to file paths
-    group_map = {}
-    for f in files:
-        fname = os.path.basename(f)
-        # Extract group name from filename (e.g., '.L.Thermodynamic-')
-        match = re.search(r'\.([CL]\.[A-Za-z0-9]+)-', fname)
-        if match:
-            group = match.group(1)
-            if group not in group_map:
-                group_map[group] = f
-
-    # Scan each group file for variables
-    menu_dict = {}
-    for group, fpath in group_map.items():
-        try:
-            with xr.open_dataset(fpath, chunks={}) as ds_meta:
-                # Filter out coordinate variables
-                vars_list = [
-                    v for v in ds_meta.data_vars
-                    if v not in ['xc', 'yc', 'zc', 'time', 'lon', 'lat', 'lev']
-                ]
-                if vars_list:
-                    menu_dict[f"File: {group}"] = sorted(vars_list)
-        except Exception as e:
-            logger.warning(f"Could not read {fpath}: {e}")
-
-    # Add diagnostic variables
-    try:
-        diag_vars = vvm.list_available_diagnostics()
-        if diag_vars:
-            menu_dict["Calc: Diagnostics"] = sorted(diag_vars)
-    except Exception as e:
-        logger.warning(f"Could not list diagnostics: {e}")
-
-    # Enrich with derived variables (e.g., Topography)
-    menu_dict = enrich_variable_groups(menu_dict)
-
-    return menu_dict
+    group_map, _ = _list_archive(sim_path)
+    return _build_variable_groups(sim_path, group_map)
 
 
 def enrich_variable_groups(groups: Dict[str, List[str]]) -> Dict[str, List[str]]:
@@ -161,10 +275,14 @@ def enrich_variable_groups(groups: Dict[str, List[str]]) -> Dict[str, List[str]]
 # Dataset Loading with Caching
 # =============================================================================
 
+@lru_cache(maxsize=256)
 def _create_time_selection(t_range: Tuple) -> vvm.TimeSelection:
     """
     Create a vvm_reader TimeSelection object.
 
+    Memoized on the (hashable) range tuple; unhashable specs go through
+    ``_time_selection``.
+
     Parameters
     ----------
     t_range : tuple
@@ -190,10 +308,14 @@ def _create_time_selection(t_range: Tuple) -> vvm.TimeSelection:
     return vvm.TimeSelection(time_index_range=t_range)
 
 
+@lru_cache(maxsize=256)
 def _create_vertical_selection(z_range: Tuple) -> Optional[vvm.VerticalSelection]:
     """
     Create a vvm_reader VerticalSelection object.
 
+    Memoized on the (hashable) range tuple; unhashable specs go through
+    ``_vertical_selection``.
+
     Parameters
     ----------
     z_range : tuple or None
@@ -224,6 +346,49 @@ def _create_vertical_selection(z_range: Tuple) -> Optional[vvm.VerticalSelection
     return vvm.VerticalSelection(height_range=z_range)
 
 
+def _time_selection(t_range: Any) -> vvm.TimeSelection:
+    """Cached _create_time_selection, bypassing the cache for unhashable specs."""
+    try:
+        return _create_time_selection(t_range)
+    except TypeError:  # unhashable (list/dict spec)
+        return _create_time_selection.__wrapped__(t_range)
+
+
+def _vertical_selection(z_range: Any) -> Optional[vvm.VerticalSelection]:
+    """Cached _create_vertical_selection, bypassing the cache for unhashable specs."""
+    try:
+        return _create_vertical_selection(z_range)
+    except TypeError:  # unhashable (list/dict spec)
+        return _create_vertical_selection.__wrapped__(z_range)
+
+
+def _choose_chunks(
+    var_name: str,
+    x_range: Tuple[int, int],
+    y_range: Tuple[int, int]
+) -> Dict[str, int]:
+    """
+    Pick Dask chunks for a variable read over an x/y index window.
+
+    - Column-integrated variables (cwv, lwp, iwp) need full vertical columns
+      (lev: -1) for efficient integration without cross-chunk communication
+    - 3D variables use lev: 1 for efficient slicing; a level plane of the
+      window is one chunk unless it exceeds DASK_CHUNK_BYTES, in which case
+      it is split into bands of whole rows (contiguous in C order)
+    """
+    if var_name in COLUMN_INTEGRATED_VARS:
+        return {'time': 1, 'lev': -1, 'lat': 128, 'lon': 128}
+
+    nx = max(1, x_range[1] - x_range[0])
+    ny = max(1, y_range[1] - y_range[0])
+    row_bytes = nx * 4  # float32
+    if ny * row_bytes <= DASK_CHUNK_BYTES:
+        lat_chunk = -1
+    else:
+        lat_chunk = max(64, DASK_CHUNK_BYTES // row_bytes)
+    return {'time': 1, 'lev': 1, 'lat': lat_chunk, 'lon': -1}
+
+
 def _open_dataset(
     sim_path: Path | str,
     var_name: str,
@@ -259,14 +424,7 @@ def _open_dataset(
     """
     logger.debug(f"Opening dataset: {var_name} in {sim_path}")
 
-    # Optimized chunking strategy:
-    # - Column-integrated variables (cwv, lwp, iwp) need full vertical columns
-    #   (lev: -1) for efficient integration without cross-chunk communication
-    # - 3D variables benefit from lev: 1 for efficient slicing
-    if var_name in ['cwv', 'lwp', 'iwp']:
-        chunks = {'time': 1, 'lev': -1, 'lat': 128, 'lon': 128}
-    else:
-        chunks = {'time': 1, 'lev': 1, 'lat': -1, 'lon': -1}
+    chunks = _choose_chunks(var_name, x_range, y_range)
 
     # Processing options for vvm_reader
     opts = vvm.ProcessingOptions(
@@ -276,12 +434,12 @@ def _open_dataset(
     )
 
     # Create selection objects
-    time_sel = _create_time_selection(t_range)
-    vert_sel = _create_vertical_selection(z_range)
+    time_sel = _time_selection(t_range)
+    vert_sel = _vertical_selection(z_range)
     region = vvm.Region(x_range=x_range, y_range=y_range)
 
     # Protect HDF5/NetCDF read with lock (prevent HDF5 segfaults)
-    with FILE_IO_LOCK:
+    with get_file_lock(sim_path):
         ds = vvm.open_vvm_dataset(
             str(sim_path),
             variables=[var_name],
@@ -294,9 +452,20 @@ def _open_dataset(
     return ds
 
 
-@lru_cache(maxsize=DATASET_CACHE_SIZE)
+def _close_evicted_dataset(key: Tuple, ds: xr.Dataset) -> None:
+    """Close file handles of a dataset evicted from the open_dataset cache."""
+    sim_path = key[0]
+    with get_file_lock(sim_path, write=True):
+        ds.close()
+
+
+@sized_lru(
+    max_bytes=config.dataset_cache_bytes,
+    max_entries=config.dataset_cache_size,
+    on_evict=_close_evicted_dataset
+)
 def open_dataset(
-    sim_path: str,  # Must be hashable for lru_cache
+    sim_path: str,  # Must be hashable for caching
     var_name: str,
     t_range: Tuple,
     z_range: Tuple,
@@ -304,10 +473,12 @@ def open_dataset(
     y_range: Tuple[int, int]
 ) -> xr.Dataset:
     """
-    Open a VVM dataset with LRU caching.
+    Open a VVM dataset with size-aware LRU caching.
 
     This function caches lazy-loaded xarray.Dataset objects at the file I/O level.
-    It maintains up to DATASET_CACHE_SIZE (default: 10) datasets in memory.
+    The cache is bounded by config.dataset_cache_bytes of (materialized) data
+    size and at most config.dataset_cache_size entries; evicted datasets are
+    closed.
 
     IMPORTANT: All parameters must be hashable for caching. Convert Path objects
     to strings and use tuples instead of lists.
@@ -351,8 +522,15 @@ def open_dataset(
 # Terrain Data Loading
 # =============================================================================
 
-# Terrain data cache: {sim_path: terrain_dataarray}
-_terrain_cache: Dict[str, xr.DataArray] = {}
+# Terrain data cache: {sim_path: terrain_dataarray}, LRU order
+TERRAIN_CACHE_SIZE = 4
+_terrain_cache: 'OrderedDict[str, xr.DataArray]' = OrderedDict()
+_terrain_cache_lock = threading.Lock()
+
+# Sliced terrain views: {(sim_path, x0, x1, y0, y1): dataarray}, LRU order
+TERRAIN_SLICE_CACHE_SIZE = 32
+_terrain_slices: 'OrderedDict[Tuple, xr.DataArray]' = OrderedDict()
+_terrain_slices_lock = threading.Lock()
 
 
 def get_terrain_data(
@@ -364,7 +542,9 @@ def get_terrain_data(
     Load terrain height data for a simulation.
 
     Terrain data is cached per simulation to avoid repeated I/O.
-    If x_range and y_range are provided, returns a sliced version.
+    If x_range and y_range are provided, returns a sliced version; the
+    most recent slices are cached too, so repeated plot updates of the
+    same region reuse them.
 
     Parameters
     ----------
@@ -394,38 +574,57 @@ def get_terrain_data(
     sim_path_str = str(sim_path)
 
     # Check cache
-    terrain_da = _terrain_cache.get(sim_path_str)
+    with _terrain_cache_lock:
+        terrain_da = _terrain_cache.get(sim_path_str)
+        if terrain_da is not None:
+            _terrain_cache.move_to_end(sim_path_str)
+
     if terrain_da is None:
         # Load terrain data with thread lock
-        with FILE_IO_LOCK:
-            terrain_da = vvm.get_terrain_height(sim_path_str)
-        _terrain_cache[sim_path_str] = terrain_da
-
-    # Slice if ranges provided
-    if x_range is not None and y_range is not None:
-        try:
-            x0, x1 = x_range
-            y0, y1 = y_range
-
-            # Ensure valid ranges
-            if x1 <= x0:
-                x1 = x0 + 1
-            if y1 <= y0:
-                y1 = y0 + 1
+        with get_file_lock(sim_path_str):
+            # Small 2D field reused by every frame: read it into memory once
+            # so slices and masks built from it are plain NumPy
+            terrain_da = vvm.get_terrain_height(sim_path_str).load()
+        # Set name for consistency (slices inherit it)
+        terrain_da.name = TERRAIN_VAR_NAME
+        with _terrain_cache_lock:
+            _terrain_cache[sim_path_str] = terrain_da
+            while len(_terrain_cache) > TERRAIN_CACHE_SIZE:
+                _terrain_cache.popitem(last=False)
+
+    if x_range is None or y_range is None:
+        return terrain_da
+
+    x0, x1 = x_range
+    y0, y1 = y_range
+
+    # Ensure valid ranges
+    if x1 <= x0:
+        x1 = x0 + 1
+    if y1 <= y0:
+        y1 = y0 + 1
+
+    key = (sim_path_str, x0, x1, y0, y1)
+    with _terrain_slices_lock:
+        sliced = _terrain_slices.get(key)
+        if sliced is not None:
+            _terrain_slices.move_to_end(key)
+            return sliced
 
-            # Identify dimension names (handle both 'lon'/'lat' and generic dims)
-            lon_dim = 'lon' if 'lon' in terrain_da.dims else list(terrain_da.dims)[-1]
-            lat_dim = 'lat' if 'lat' in terrain_da.dims else list(terrain_da.dims)[0]
+    try:
+        # Identify dimension names (handle both 'lon'/'lat' and generic dims)
+        lon_dim = 'lon' if 'lon' in terrain_da.dims else terrain_da.dims[-1]
+        lat_dim = 'lat' if 'lat' in terrain_da.dims else terrain_da.dims[0]
 
-            sliced = terrain_da.isel({lon_dim: slice(x0, x1), lat_dim: slice(y0, y1)})
-        except Exception as e:
-            logger.warning(f"Could not slice terrain data: {e}")
-            sliced = terrain_da
-    else:
-        sliced = terrain_da
+        sliced = terrain_da.isel({lon_dim: slice(x0, x1), lat_dim: slice(y0, y1)})
+    except Exception as e:
+        logger.warning(f"Could not slice terrain data: {e}")
+        return terrain_da
 
-    # Set name for consistency
-    sliced.name = TERRAIN_VAR_NAME
+    with _terrain_slices_lock:
+        _terrain_slices[key] = sliced
+        while len(_terrain_slices) > TERRAIN_SLICE_CACHE_SIZE:
+            _terrain_slices.popitem(last=False)
 
     return sliced
 
@@ -434,6 +633,21 @@ def get_terrain_data(
 # Simulation Metadata Queries
 # =============================================================================
 
+# The queries below are memoized per (sim_path, archive/ mtime): simulation
+# metadata does not change while a run's output is only read. Returned
+# dicts are shared between callers and must be treated as read-only.
+
+
+def _sim_key(sim_path: Path | str) -> Tuple[str, int]:
+    """Cache key for per-simulation metadata: (path, archive/ mtime)."""
+    sim_path = str(sim_path)
+    try:
+        mtime_ns = os.stat(os.path.join(sim_path, 'archive')).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return sim_path, mtime_ns
+
+
 def get_coordinate_info(sim_path: Path | str) -> Dict[str, Any]:
     """
     Get coordinate information for a simulation.
@@ -454,8 +668,13 @@ def get_coordinate_info(sim_path: Path | str) -> Dict[str, Any]:
     >>> info = get_coordinate_info('/data2/VVM/sim001/')
     >>> print(f"Grid size: {info['nx']} x {info['ny']}")
     """
-    with FILE_IO_LOCK:
-        return vvm.get_coordinate_info(str(sim_path))
+    return _coordinate_info(*_sim_key(sim_path))
+
+
+@lru_cache(maxsize=128)
+def _coordinate_info(sim_path: str, mtime_ns: int) -> Dict[str, Any]:
+    with get_file_lock(sim_path):
+        return vvm.get_coordinate_info(sim_path)
 
 
 def get_vertical_info(sim_path: Path | str) -> Dict[str, Any]:
@@ -478,8 +697,13 @@ def get_vertical_info(sim_path: Path | str) -> Dict[str, Any]:
     >>> info = get_vertical_info('/data2/VVM/sim001/')
     >>> print(f"Height range: {info['height_range']}")
     """
-    with FILE_IO_LOCK:
-        return vvm.get_vertical_info(str(sim_path))
+    return _vertical_info(*_sim_key(sim_path))
+
+
+@lru_cache(maxsize=128)
+def _vertical_info(sim_path: str, mtime_ns: int) -> Dict[str, Any]:
+    with get_file_lock(sim_path):
+        return vvm.get_vertical_info(sim_path)
 
 
 def get_terrain_info(sim_path: Path | str) -> Optional[Dict[str, Any]]:
@@ -504,13 +728,19 @@ def get_terrain_info(sim_path: Path | str) -> Optional[Dict[str, Any]]:
     ...     is_flat = (info['max_level'] == info['min_level'] == 0)
     """
     try:
-        with FILE_IO_LOCK:
-            return vvm.get_terrain_info(str(sim_path))
+        return _terrain_info(*_sim_key(sim_path))
     except Exception as e:
+        # Failures are not cached (lru_cache does not store exceptions)
         logger.warning(f"Could not get terrain info for {sim_path}: {e}")
         return None
 
 
+@lru_cache(maxsize=128)
+def _terrain_info(sim_path: str, mtime_ns: int) -> Dict[str, Any]:
+    with get_file_lock(sim_path):
+        return vvm.get_terrain_info(sim_path)
+
+
 def scan_time_indices(sim_path: Path | str) -> List[int]:
     """
     Scan available time indices from NetCDF filenames in archive/.
@@ -539,18 +769,80 @@ def scan_time_indices(sim_path: Path | str) -> List[int]:
     """
     sim_path = Path(sim_path) if isinstance(sim_path, str) else sim_path
 
-    archive_dir = sim_path / 'archive'
-    nc_files = sorted(glob(str(archive_dir / "*.nc")))
+    _, indices = _list_archive(sim_path)
 
-    indices = set()  # Use set to avoid duplicates from different variable files
-    for f in nc_files:
-        # Extract 6-digit index from filename (e.g., '-000120.nc')
-        match = re.search(r'-(\d{6})\.nc$', f)
-        if match:
-            indices.add(int(match.group(1)))
-
-    if indices:
-        return sorted(indices)
-    else:
-        # Fallback
-        return [0]
+    # Fallback: [0] if no files found
+    return indices or [0]
+
+
+# =============================================================================
+# Fused Simulation Scan
+# =============================================================================
+
+@dataclass(frozen=True)
+class SimMeta:
+    """
+    Simulation metadata gathered in one pass by scan_simulation.
+
+    Attributes
+    ----------
+    sim_path : str
+        Path to the simulation directory
+    variable_groups : dict
+        As returned by scan_variable_groups
+    time_indices : list of int
+        As returned by scan_time_indices
+    vertical : dict
+        As returned by get_vertical_info
+    coords : dict
+        As returned by get_coordinate_info
+    """
+    sim_path: str
+    variable_groups: Dict[str, List[str]]
+    time_indices: List[int]
+    vertical: Dict[str, Any]
+    coords: Dict[str, Any]
+
+
+def scan_simulation(sim_path: Path | str) -> SimMeta:
+    """
+    Gather all metadata needed to open a simulation in one pass.
+
+    Lists archive/ once (group files and time indices together), reads each
+    group file header once, and queries vertical/coordinate info once. The
+    result is memoized per process until archive/ is modified, so switching
+    back to a simulation costs one stat.
+
+    Parameters
+    ----------
+    sim_path : Path or str
+        Path to VVM simulation directory
+
+    Returns
+    -------
+    SimMeta
+        Variable groups, time indices, vertical and coordinate info.
+        Treat as read-only: the instance is shared between sessions.
+
+    Examples
+    --------
+    >>> meta = scan_simulation('/data2/VVM/sim001/')
+    >>> print(len(meta.time_indices), meta.coords['nx'])
+    """
+    return _scan_simulation(*_sim_key(sim_path))
+
+
+@lru_cache(maxsize=16)
+def _scan_simulation(sim_path: str, mtime_ns: int) -> SimMeta:
+    logger.info(f"Scanning simulation directory: {sim_path}")
+
+    path = Path(sim_path)
+    group_map, time_indices = _list_archive(path)
+
+    return SimMeta(
+        sim_path=sim_path,
+        variable_groups=_build_variable_groups(path, group_map),
+        time_indices=time_indices or [0],
+        vertical=_vertical_info(sim_path, mtime_ns),
+        coords=_coordinate_info(sim_path, mtime_ns)
+    )
@@ -6,14 +6,26 @@ including main variables, wind vectors, and contour overlays.
 """
 
 import logging
-from typing import Tuple, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Tuple, Optional, List
+import dask
+import numpy as np
 import xarray as xr
 
-from vvmviz.config import TERRAIN_VAR_NAME, FILE_IO_LOCK
+from vvmviz.config import TERRAIN_VAR_NAME
 from vvmviz.core.data_loader import open_dataset, get_terrain_data
 
 logger = logging.getLogger(__name__)
 
+# Threads for opening a frame's main/wind/contour layers concurrently
+# (one per layer; threads start on first use)
+_BRANCH_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix='vvmviz-frame')
+
+# Threads for the surface-wind component reads (separate from
+# _BRANCH_POOL, whose wind task waits on them)
+_WIND_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='vvmviz-wind')
+
 
 # =============================================================================
 # Data Array Extraction
@@ -91,11 +103,25 @@ def get_data_array(
         return ds[var_name]
 
     # Handle suffix mismatch (e.g., 'u' might be stored as 'u_sfc')
-    for v in ds.data_vars:
-        if v.startswith(var_name):
-            return ds[v]
+    name = _var_index(ds).get(var_name)
+    return ds[name] if name is not None else None
+
+
+def _var_index(ds: xr.Dataset) -> dict:
+    """
+    Map every prefix of ds's variable names to the first variable having it.
 
-    return None
+    Built on first use and kept in the (cached, shared) dataset's attrs, so
+    later suffix lookups are one dict probe instead of a scan.
+    """
+    index = ds.attrs.get('_vvm_var_index')
+    if index is None:
+        index = {}
+        for v in ds.data_vars:
+            for i in range(1, len(v) + 1):
+                index.setdefault(v[:i], v)
+        ds.attrs['_vvm_var_index'] = index
+    return index
 
 
 # =============================================================================
@@ -153,7 +179,7 @@ def get_wind_vectors(
         if use_surface:
             # Optimized Surface Wind: composite of ocean (lev 1) and land (lev 2)
             terrain_da = get_terrain_data(sim_path, x_range, y_range)
-            land_mask = terrain_da > 0
+            land_mask = terrain_da.copy(data=terrain_da.values > 0)
 
             # Extract single time index
             if isinstance(t_range, tuple) and len(t_range) == 2:
@@ -161,42 +187,28 @@ def get_wind_vectors(
             else:
                 t_idx = 0
 
-            # Load ocean surface wind (index level 1)
-            with FILE_IO_LOCK:
-                u_ocean = get_data_array(
-                    sim_path, 'u',
+            # Ocean surface wind is index level 1, land surface wind level 2;
+            # read both levels of each component as one slab, concurrently
+            futures = {
+                var: _WIND_POOL.submit(
+                    get_data_array, sim_path, var,
                     t_range=(t_idx, t_idx),
-                    z_range=('index', 1, 1),
-                    x_range=x_range,
-                    y_range=y_range,
-                    use_cache=use_cache
-                )
-                v_ocean = get_data_array(
-                    sim_path, 'v',
-                    t_range=(t_idx, t_idx),
-                    z_range=('index', 1, 1),
+                    z_range=('index', 1, 2),
                     x_range=x_range,
                     y_range=y_range,
                     use_cache=use_cache
                 )
+                for var in ('u', 'v')
+            }
+            u_da = futures['u'].result()
+            v_da = futures['v'].result()
 
-                # Load land surface wind (index level 2)
-                u_land = get_data_array(
-                    sim_path, 'u',
-                    t_range=(t_idx, t_idx),
-                    z_range=('index', 2, 2),
-                    x_range=x_range,
-                    y_range=y_range,
-                    use_cache=use_cache
-                )
-                v_land = get_data_array(
-                    sim_path, 'v',
-                    t_range=(t_idx, t_idx),
-                    z_range=('index', 2, 2),
-                    x_range=x_range,
-                    y_range=y_range,
-                    use_cache=use_cache
-                )
+            u_ocean = v_ocean = u_land = v_land = None
+            if u_da is not None and v_da is not None:
+                lev_dim = 'lev' if 'lev' in u_da.dims else u_da.dims[-3]
+                if u_da.sizes[lev_dim] == 2:
+                    u_ocean, u_land = u_da.isel({lev_dim: 0}), u_da.isel({lev_dim: 1})
+                    v_ocean, v_land = v_da.isel({lev_dim: 0}), v_da.isel({lev_dim: 1})
 
             # Check all components loaded successfully
             if all(x is not None for x in [u_ocean, v_ocean, u_land, v_land]):
@@ -210,10 +222,14 @@ def get_wind_vectors(
                 # Align land_mask to wind data to avoid 'join=exact' mismatch
                 # Wind data and terrain might be sliced slightly differently
                 land_mask = land_mask.reindex_like(u_ocean, method='nearest')
-                
-                # Composite: use ocean wind over ocean, land wind over land
-                u_comp = u_ocean.where(~land_mask, u_land)
-                v_comp = v_ocean.where(~land_mask, v_land)
+                mask = land_mask.transpose(*u_ocean.dims).values
+
+                # Composite: use ocean wind over ocean, land wind over land.
+                # Both levels come from one slab on the same grid, so skip
+                # xarray alignment and select on the raw arrays (np.where
+                # dispatches to dask for lazy ones)
+                u_comp = u_ocean.copy(data=np.where(mask, u_land.data, u_ocean.data))
+                v_comp = v_ocean.copy(data=np.where(mask, v_land.data, v_ocean.data))
 
                 return (u_comp, v_comp)
             else:
@@ -221,23 +237,22 @@ def get_wind_vectors(
 
         else:
             # Level-based wind
-            with FILE_IO_LOCK:
-                u_da = get_data_array(
-                    sim_path, 'u',
-                    t_range=t_range,
-                    z_range=z_range,
-                    x_range=x_range,
-                    y_range=y_range,
-                    use_cache=use_cache
-                )
-                v_da = get_data_array(
-                    sim_path, 'v',
-                    t_range=t_range,
-                    z_range=z_range,
-                    x_range=x_range,
-                    y_range=y_range,
-                    use_cache=use_cache
-                )
+            u_da = get_data_array(
+                sim_path, 'u',
+                t_range=t_range,
+                z_range=z_range,
+                x_range=x_range,
+                y_range=y_range,
+                use_cache=use_cache
+            )
+            v_da = get_data_array(
+                sim_path, 'v',
+                t_range=t_range,
+                z_range=z_range,
+                x_range=x_range,
+                y_range=y_range,
+                use_cache=use_cache
+            )
 
             if u_da is not None and v_da is not None:
                 return (u_da, v_da)
@@ -320,6 +335,55 @@ def get_contour_data(
 # Multi-layer Frame Bundle Loading
 # =============================================================================
 
+@dataclass(slots=True, frozen=True)
+class FrameBundle:
+    """
+    All data layers needed to render a single frame.
+
+    Bundles are immutable: cached bundles are shared between sessions and
+    the prefetch thread, so derived bundles are built with ``replace``.
+
+    Attributes
+    ----------
+    t_range : tuple
+        Time range used
+    z_range : tuple or None
+        Vertical range used
+    main_var : str
+        Main variable name
+    main : xr.DataArray, optional
+        Main variable
+    wind : tuple of xr.DataArray, optional
+        (u, v) wind components
+    contour : xr.DataArray, optional
+        Contour overlay variable
+    """
+    t_range: Tuple
+    z_range: Optional[Tuple]
+    main_var: str
+    main: Optional[xr.DataArray] = None
+    wind: Optional[Tuple[xr.DataArray, xr.DataArray]] = None
+    contour: Optional[xr.DataArray] = None
+
+    def layers(self) -> List[xr.DataArray]:
+        """Loaded layers in order: main, u, v, contour."""
+        return [f for f in (self.main, *(self.wind or ()), self.contour) if f is not None]
+
+    def astype(self, dtype) -> 'FrameBundle':
+        """Return a copy with floating-point layers cast to dtype."""
+        dtype = np.dtype(dtype)
+        cast = iter([
+            f.astype(dtype) if np.issubdtype(f.dtype, np.floating) else f
+            for f in self.layers()
+        ])
+        return replace(
+            self,
+            main=next(cast) if self.main is not None else None,
+            wind=(next(cast), next(cast)) if self.wind is not None else None,
+            contour=next(cast) if self.contour is not None else None
+        )
+
+
 def load_frame_bundle(
     sim_path: str,
     main_var: str,
@@ -333,7 +397,7 @@ def load_frame_bundle(
     contour_var: Optional[str] = None,
     use_cache: bool = True,
     compute: bool = False
-) -> Dict[str, Any]:
+) -> FrameBundle:
     """
     Load a complete frame bundle including main variable, wind, and contour.
 
@@ -371,14 +435,9 @@ def load_frame_bundle(
 
     Returns
     -------
-    dict
-        Bundle dictionary with keys:
-        - 't_range': Time range used
-        - 'z_range': Vertical range used
-        - 'main_var': Main variable name
-        - 'main': Main variable DataArray (optional)
-        - 'wind': Tuple of (u, v) DataArrays (optional)
-        - 'contour': Contour variable DataArray (optional)
+    FrameBundle
+        Bundle with t_range, z_range, main_var and the optional layers
+        main, wind (u, v) and contour (None when not loaded)
 
     Examples
     --------
@@ -393,16 +452,9 @@ def load_frame_bundle(
     ...     contour_enabled=True,
     ...     contour_var='w'
     ... )
-    >>> print('main' in bundle, 'wind' in bundle, 'contour' in bundle)
+    >>> print(bundle.main is not None, bundle.wind is not None)
     """
-    result = {
-        't_range': t_range,
-        'z_range': z_range,
-        'main_var': main_var
-    }
-
-    # 1. Load Main Variable
-    with FILE_IO_LOCK:
+    def load_main():
         da = get_data_array(
             sim_path, main_var,
             t_range=t_range,
@@ -411,12 +463,9 @@ def load_frame_bundle(
             y_range=y_range,
             use_cache=use_cache
         )
+        return da
 
-    if da is not None:
-        result['main'] = da.compute() if compute else da
-
-    # 2. Load Wind (if enabled)
-    if wind_enabled:
+    def load_wind():
         wind_data = get_wind_vectors(
             sim_path,
             t_range=t_range,
@@ -426,16 +475,9 @@ def load_frame_bundle(
             use_surface=use_surface_wind,
             use_cache=use_cache
         )
+        return tuple(wind_data) if wind_data is not None else None
 
-        if wind_data is not None:
-            u_da, v_da = wind_data
-            if compute:
-                result['wind'] = (u_da.compute(), v_da.compute())
-            else:
-                result['wind'] = (u_da, v_da)
-
-    # 3. Load Contour (if enabled)
-    if contour_enabled and contour_var:
+    def load_contour():
         contour_da = get_contour_data(
             sim_path, contour_var,
             t_range=t_range,
@@ -444,11 +486,40 @@ def load_frame_bundle(
             y_range=y_range,
             use_cache=use_cache
         )
+        return contour_da
+
+    # 1-3. Main variable, wind and contour (each optional but main)
+    branches = [load_main]
+    if wind_enabled:
+        branches.append(load_wind)
+    if contour_enabled and contour_var:
+        branches.append(load_contour)
+
+    if len(branches) > 1:
+        # Branches open different files (with a thread-safe HDF5 the opens
+        # overlap; otherwise they queue on the file lock)
+        futures = [_BRANCH_POOL.submit(branch) for branch in branches]
+        results = {branch: future.result() for branch, future in zip(branches, futures)}
+    else:
+        results = {branch: branch() for branch in branches}
 
-        if contour_da is not None:
-            result['contour'] = contour_da.compute() if compute else contour_da
+    main = results[load_main]
+    wind = results.get(load_wind)
+    contour = results.get(load_contour)
 
-    return result
+    # Compute all lazy layers in one scheduler call, so their chunk reads
+    # share one thread pool fan-out instead of running layer by layer
+    if compute:
+        lazy = [da for da in (main, *(wind or ()), contour) if da is not None]
+        computed = iter(dask.compute(*lazy))
+        main = next(computed) if main is not None else None
+        wind = (next(computed), next(computed)) if wind is not None else None
+        contour = next(computed) if contour is not None else None
+
+    return FrameBundle(
+        t_range=t_range, z_range=z_range, main_var=main_var,
+        main=main, wind=wind, contour=contour
+    )
 
 
 # =============================================================================
@@ -480,14 +551,11 @@ def squeeze_singleton_dims(da: xr.DataArray) -> xr.DataArray:
     >>> print(da_clean.dims)
     ('lat', 'lon')
     """
-    # Identify dimensions with size 1
-    singleton_dims = [dim for dim in da.dims if da.sizes[dim] == 1]
-
-    # Squeeze them out
-    if singleton_dims:
-        da = da.squeeze(singleton_dims)
+    # Identify dimensions with size 1 (one pass over the sizes mapping)
+    singleton_dims = [dim for dim, size in da.sizes.items() if size == 1]
 
-    return da
+    # Squeeze them out; the common no-op returns the input unchanged
+    return da.squeeze(singleton_dims) if singleton_dims else da
 
 
 def select_single_time_level(
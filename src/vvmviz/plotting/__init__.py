@@ -25,18 +25,24 @@ from vvmviz.plotting.colormaps import (
 # Overlay functions
 from vvmviz.plotting.overlays import (
     create_wind_vectors,
+    subsample_vectors,
+    wind_speed_direction,
     create_contour_overlay,
     get_county_boundaries,
     get_town_boundaries,
+    preload_boundaries,
 )
 
 # Core plotting functions
 from vvmviz.plotting.base import (
     calculate_color_limits,
+    nan_minmax,
+    coord_extent,
     create_image,
     compose_plot,
     apply_ranges,
     create_main_plot,
+    downsample_for_preview,
 )
 
 __all__ = [
@@ -52,14 +58,20 @@ __all__ = [
 
     # Overlay exports
     'create_wind_vectors',
+    'subsample_vectors',
+    'wind_speed_direction',
     'create_contour_overlay',
     'get_county_boundaries',
     'get_town_boundaries',
+    'preload_boundaries',
 
     # Core plotting exports
     'calculate_color_limits',
+    'nan_minmax',
+    'coord_extent',
     'create_image',
     'compose_plot',
     'apply_ranges',
     'create_main_plot',
+    'downsample_for_preview',
 ]
@@ -9,13 +9,17 @@ This module provides the core plotting functionality for VVMViz:
 """
 
 import logging
+import warnings
+from functools import lru_cache
 from typing import Optional, Tuple, List, Any
 
+import numpy as np
 import xarray as xr
 import holoviews as hv
 import holoviews.operation.datashader as hd
 
 from vvmviz.plotting.colormaps import resolve_colormap
+from vvmviz.utils.jit import HAS_NUMBA, njit, FASTMATH
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +28,77 @@ logger = logging.getLogger(__name__)
 # Color Limit Handling
 # =============================================================================
 
+@njit(cache=True, fastmath=FASTMATH)
+def _nan_minmax_jit(values):
+    vmin = np.inf
+    vmax = -np.inf
+    found = False
+    for x in values:
+        if np.isnan(x):
+            continue
+        found = True
+        if x < vmin:
+            vmin = x
+        if x > vmax:
+            vmax = x
+    if not found:
+        return np.nan, np.nan
+    return vmin, vmax
+
+
+def nan_minmax(values: np.ndarray) -> Tuple[float, float]:
+    """
+    Minimum and maximum of an array, ignoring NaN (masked terrain).
+
+    Uses one pass over the data when Numba is available.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Input array (any shape)
+
+    Returns
+    -------
+    tuple of float
+        (min, max), or (nan, nan) if every value is NaN
+    """
+    values = np.asarray(values)
+    if values.size == 0:
+        return (np.nan, np.nan)
+
+    if HAS_NUMBA and np.issubdtype(values.dtype, np.floating):
+        vmin, vmax = _nan_minmax_jit(values.ravel())
+        return (float(vmin), float(vmax))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN
+        return (float(np.nanmin(values)), float(np.nanmax(values)))
+
+
+def coord_extent(coord: xr.DataArray | np.ndarray) -> Tuple[float, float]:
+    """
+    (min, max) of a 1D grid coordinate.
+
+    Grid coordinates are monotonic, so the end points are read directly;
+    only a coordinate that is not ascending falls back to a full scan.
+
+    Parameters
+    ----------
+    coord : xr.DataArray or np.ndarray
+        1D coordinate values
+
+    Returns
+    -------
+    tuple of float
+        (min, max)
+    """
+    values = np.asarray(getattr(coord, 'values', coord))
+    first, last = float(values[0]), float(values[-1])
+    if first <= last:
+        return (first, last)
+    return (float(values.min()), float(values.max()))
+
+
 def calculate_color_limits(
     da: xr.DataArray,
     lock_clim: bool = False,
@@ -63,9 +138,8 @@ def calculate_color_limits(
         # Use locked values
         return (float(vmin), float(vmax))
 
-    # Compute from data
-    current_min = float(da.min().values)
-    current_max = float(da.max().values)
+    # Compute from data (both limits from one read of the array)
+    current_min, current_max = nan_minmax(da.values)
 
     if symmetric:
         abs_max = max(abs(current_min), abs(current_max))
@@ -78,6 +152,45 @@ def calculate_color_limits(
 # Main Image Creation
 # =============================================================================
 
+def _coord_units(da: xr.DataArray | xr.Dataset, dim: str) -> str:
+    """Units attribute of a coordinate ('' if absent)."""
+    if dim in da.coords:
+        return da.coords[dim].attrs.get('units', '')
+    return ''
+
+
+@lru_cache(maxsize=64)
+def _image_dims(
+    var_name: str,
+    lon_dim: str,
+    lat_dim: str,
+    lon_units: str,
+    lat_units: str,
+    long_name: str,
+    units: str
+) -> Tuple[Tuple[hv.Dimension, hv.Dimension], hv.Dimension]:
+    """
+    Build the key dimensions and main value dimension for create_image.
+
+    Memoized: the same few variables are drawn over and over while
+    scrubbing, and HoloViews Dimension construction is comparatively slow.
+    """
+    # Create dimension objects with nice labels
+    lon_label = f'longitude ({lon_units})' if lon_units else 'longitude'
+    lat_label = f'latitude ({lat_units})' if lat_units else 'latitude'
+    kdims = (
+        hv.Dimension(lon_dim, label=lon_label),
+        hv.Dimension(lat_dim, label=lat_label)
+    )
+
+    # Use hv.Dimension for the main variable to enforce the label
+    var_label = long_name if long_name else var_name
+    if units and units != 'N/A':
+        var_label += f' ({units})'
+
+    return kdims, hv.Dimension(var_name, label=var_label)
+
+
 def create_image(
     da: xr.DataArray,
     cmap: Any,
@@ -87,15 +200,16 @@ def create_image(
     hover_dims: Optional[List[str]] = None,
     frame_height: int = 500,
     alpha: float = 0.9,
-    dynamic: bool = True
-) -> hv.DynamicMap:
+    dynamic: bool = True,
+    rasterize: bool = True
+) -> hv.Element:
     """
     Create main image visualization with Datashader rasterization.
 
     This function:
     1. Converts DataArray to HoloViews Dataset
     2. Creates Image element
-    3. Applies Datashader rasterization for performance
+    3. Applies Datashader rasterization for performance (optional)
     4. Configures colormap, limits, and interactive tools
 
     Parameters
@@ -118,11 +232,15 @@ def create_image(
         Image transparency (0-1)
     dynamic : bool, default=True
         Use dynamic rasterization (recomputes on zoom)
+    rasterize : bool, default=True
+        If False, skip Datashader and return the plain Image element. The
+        array is then sent to the browser once and colormapped client-side,
+        which is cheaper per frame for grids that fit the screen.
 
     Returns
     -------
-    hv.DynamicMap
-        Rasterized image ready for display
+    hv.DynamicMap or hv.Image
+        Rasterized image (or plain Image) ready for display
 
     Examples
     --------
@@ -145,71 +263,46 @@ def create_image(
             if not var_name:
                 # Fallback: take the first data variable
                 var_name = list(da.data_vars)[0]
-            
-            # Use dims of the main variable
             main_da = da[var_name]
-            lon_dim = 'lon' if 'lon' in main_da.dims else main_da.dims[-1]
-            lat_dim = 'lat' if 'lat' in main_da.dims else main_da.dims[0]
         else:
             # DataArray
             var_name = da.name if da.name else 'data'
-            lon_dim = 'lon' if 'lon' in da.dims else da.dims[-1]
-            lat_dim = 'lat' if 'lat' in da.dims else da.dims[0]
-
-        # Create dimension objects with nice labels
-        lon_label = 'longitude'
-        lat_label = 'latitude'
-        
-        # Try to get units or long_name if available
-        if lon_dim in da.coords:
-            units = da.coords[lon_dim].attrs.get('units', '')
-            if units:
-                lon_label += f' ({units})'
-        
-        if lat_dim in da.coords:
-            units = da.coords[lat_dim].attrs.get('units', '')
-            if units:
-                lat_label += f' ({units})'
-
-        kdims = [
-            hv.Dimension(lon_dim, label=lon_label),
-            hv.Dimension(lat_dim, label=lat_label)
-        ]
-
-        # Create dimension for the main variable with label
-        if isinstance(da, xr.Dataset):
-            da_attrs = da[var_name].attrs
-        else:
-            da_attrs = da.attrs
-            
-        var_label = var_name
-        long_name = da_attrs.get('long_name', '')
-        units = da_attrs.get('units', '')
-        
-        if long_name:
-            var_label = long_name
-        if units and units != 'N/A':
-            var_label += f' ({units})'
+            main_da = da
+
+        lon_dim = 'lon' if 'lon' in main_da.dims else main_da.dims[-1]
+        lat_dim = 'lat' if 'lat' in main_da.dims else main_da.dims[0]
+
+        # Dimension objects depend only on names and labels; reuse them
+        kdims, main_vdim = _image_dims(
+            var_name, lon_dim, lat_dim,
+            _coord_units(da, lon_dim),
+            _coord_units(da, lat_dim),
+            main_da.attrs.get('long_name', ''),
+            main_da.attrs.get('units', '')
+        )
+        kdims = list(kdims)
 
         # Prepare value dimensions for hover
-        # Use hv.Dimension for the main variable to enforce the label
-        main_vdim = hv.Dimension(var_name, label=var_label)
         vdims = [main_vdim]
-        
         if hover_dims:
             vdims.extend(hover_dims)
 
-        # Convert to HoloViews Dataset
-        if isinstance(da, xr.Dataset):
-            ds = hv.Dataset(da, kdims=kdims, vdims=vdims)
+        # Create raw image element
+        if isinstance(da, xr.DataArray) and da.ndim == 2 and not hover_dims:
+            # Plain 2D field: build the Image from its arrays directly
+            raw_img = hv.Image(
+                (da[lon_dim].values, da[lat_dim].values,
+                 da.transpose(lat_dim, lon_dim).values),
+                kdims=kdims, vdims=vdims
+            )
         else:
+            # Convert to HoloViews Dataset
             ds = hv.Dataset(da, kdims=kdims, vdims=vdims)
-
-        # Create raw image element
-        raw_img = ds.to(hv.Image, kdims=kdims, vdims=vdims)
+            raw_img = ds.to(hv.Image, kdims=kdims, vdims=vdims)
 
         # Apply Datashader rasterization
-        img = hd.rasterize(raw_img, dynamic=dynamic).opts(
+        img = hd.rasterize(raw_img, dynamic=dynamic) if rasterize else raw_img
+        img = img.opts(
             cmap=cmap,
             clim=clim,
             colorbar=True,
@@ -230,6 +323,56 @@ def create_image(
         raise
 
 
+# =============================================================================
+# Preview (Pyramid) Level
+# =============================================================================
+
+def downsample_for_preview(
+    data: xr.DataArray | xr.Dataset,
+    factor: int
+) -> xr.DataArray | xr.Dataset:
+    """
+    Build a coarse pyramid level by striding the horizontal dimensions.
+
+    The result is a view (no copy), so a coarse level can be shown
+    immediately while the full-resolution level is rendered afterwards.
+
+    Parameters
+    ----------
+    data : xr.DataArray or xr.Dataset
+        2D field (Dataset: uses the dims of its 'main_var')
+    factor : int
+        Keep every factor-th point along lon and lat
+
+    Returns
+    -------
+    xr.DataArray or xr.Dataset
+        Strided view of the data
+
+    Examples
+    --------
+    >>> coarse = downsample_for_preview(data, 4)
+    >>> coarse.shape
+    (64, 64)
+    """
+    if factor <= 1:
+        return data
+
+    if isinstance(data, xr.Dataset):
+        var_name = data.attrs.get('main_var') or list(data.data_vars)[0]
+        dims = data[var_name].dims
+    else:
+        dims = data.dims
+
+    lon_dim = 'lon' if 'lon' in dims else dims[-1]
+    lat_dim = 'lat' if 'lat' in dims else dims[0]
+
+    return data.isel({
+        lon_dim: slice(None, None, factor),
+        lat_dim: slice(None, None, factor)
+    })
+
+
 # =============================================================================
 # Multi-Layer Composition
 # =============================================================================
@@ -308,13 +451,16 @@ def apply_ranges(
     >>> plot = create_image(data, cmap, clim=(0, 1))
     >>> zoomed_plot = apply_ranges(plot, x_range=(5, 8), y_range=(2, 6))
     """
+    limits = {}
     if x_range and all(v is not None for v in x_range):
-        plot_obj = plot_obj.opts(xlim=x_range)
-        logger.debug(f"Applied x_range: {x_range}")
-
+        limits['xlim'] = x_range
     if y_range and all(v is not None for v in y_range):
-        plot_obj = plot_obj.opts(ylim=y_range)
-        logger.debug(f"Applied y_range: {y_range}")
+        limits['ylim'] = y_range
+
+    # One opts call (each call clones the element); none if nothing to set
+    if limits:
+        plot_obj = plot_obj.opts(**limits)
+        logger.debug(f"Applied ranges: {limits}")
 
     return plot_obj
 
@@ -338,7 +484,9 @@ def create_main_plot(
     x_range: Optional[Tuple[float, float]] = None,
     y_range: Optional[Tuple[float, float]] = None,
     frame_height: int = 500,
-    alpha: float = 0.9
+    alpha: float = 0.9,
+    rasterize: bool = True,
+    preview_factor: int = 1
 ) -> hv.Element:
     """
     High-level function to create complete visualization.
@@ -382,6 +530,11 @@ def create_main_plot(
         Plot height in pixels
     alpha : float, default=0.9
         Image transparency
+    rasterize : bool, default=True
+        Rasterize the image with Datashader (False: plain Image element)
+    preview_factor : int, default=1
+        If > 1, render a coarse pyramid level (every n-th point) for a fast
+        first paint; color limits and bounds still use the full data
 
     Returns
     -------
@@ -422,27 +575,24 @@ def create_main_plot(
     # Step 1: Resolve colormap
     cmap = resolve_colormap(cmap_name, reverse=reverse_cmap)
 
-    # Identify main variable for limits calculation
+    # Identify main variable (used for limits and bounds)
     if isinstance(da, xr.Dataset):
-        var_name = da.attrs.get('main_var')
-        if not var_name:
-            var_name = list(da.data_vars)[0]
-        main_da_for_limits = da[var_name]
+        main_da = da[da.attrs.get('main_var') or next(iter(da.data_vars))]
     else:
-        main_da_for_limits = da
+        main_da = da
 
     # Step 2: Calculate color limits
     clim = calculate_color_limits(
-        main_da_for_limits,
+        main_da,
         lock_clim=lock_clim,
         vmin=vmin,
         vmax=vmax,
         symmetric=symmetric_clim
     )
 
-    # Step 3: Create base image
+    # Step 3: Create base image (optionally from the coarse pyramid level)
     base_image = create_image(
-        da,
+        downsample_for_preview(da, preview_factor),
         cmap=cmap,
         clim=clim,
         scale=scale,
@@ -450,7 +600,8 @@ def create_main_plot(
         hover_dims=hover_dims,
         frame_height=frame_height,
         alpha=alpha,
-        dynamic=True
+        dynamic=True,
+        rasterize=rasterize
     )
 
     # Step 4: Compose with overlays
@@ -459,33 +610,21 @@ def create_main_plot(
     # Step 5: Determine and Apply Ranges
     # If ranges are not provided, default to the data bounds to prevent
     # overlays (like country boundaries) from expanding the view.
-    
-    # Identify main variable/dimensions to get bounds
-    if isinstance(da, xr.Dataset):
-        var_name = da.attrs.get('main_var')
-        if not var_name:
-            var_name = list(da.data_vars)[0]
-        main_da_dims = da[var_name]
-    else:
-        main_da_dims = da
+    # Overlays may also be composed in later by the caller, so always set them.
 
-    lon_dim = 'lon' if 'lon' in main_da_dims.dims else main_da_dims.dims[-1]
-    lat_dim = 'lat' if 'lat' in main_da_dims.dims else main_da_dims.dims[0]
+    lon_dim = 'lon' if 'lon' in main_da.dims else main_da.dims[-1]
+    lat_dim = 'lat' if 'lat' in main_da.dims else main_da.dims[0]
 
     # Calculate data bounds if not provided
     if not x_range:
         try:
-            x_min = float(main_da_dims[lon_dim].min())
-            x_max = float(main_da_dims[lon_dim].max())
-            x_range = (x_min, x_max)
+            x_range = coord_extent(main_da[lon_dim])
         except Exception as e:
             logger.warning(f"Could not calculate x bounds: {e}")
 
     if not y_range:
         try:
-            y_min = float(main_da_dims[lat_dim].min())
-            y_max = float(main_da_dims[lat_dim].max())
-            y_range = (y_min, y_max)
+            y_range = coord_extent(main_da[lat_dim])
         except Exception as e:
             logger.warning(f"Could not calculate y bounds: {e}")
 
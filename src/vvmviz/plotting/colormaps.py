@@ -8,9 +8,12 @@ This module provides colormap-related functionality for VVMViz visualization:
 - Colormap resolution and reversal logic
 """
 
+import re
 import logging
 import fnmatch
-from typing import Dict, List, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Tuple
 
 import matplotlib.pyplot as plt
 
@@ -26,7 +29,7 @@ logger = logging.getLogger(__name__)
 # NCL Colormap Categories
 # =============================================================================
 
-NCL_CMAP_CATEGORIES = {
+_NCL_CMAP_CATEGORIES = {
     "Rainbow": [
         "BlAqGrYeOrRe",
         "BlAqGrYeOrReVi200",
@@ -82,8 +85,15 @@ NCL_CMAP_CATEGORIES = {
     ]
 }
 
-# Flatten all colormaps into a single list
-ALL_NCL_CMAPS = [cmap for category in NCL_CMAP_CATEGORIES.values() for cmap in category]
+# Frozen at import: shared read-only (and copy-on-write across forked workers)
+NCL_CMAP_CATEGORIES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    category: tuple(cmap_names) for category, cmap_names in _NCL_CMAP_CATEGORIES.items()
+})
+
+# Flatten all colormaps into a single tuple
+ALL_NCL_CMAPS: Tuple[str, ...] = tuple(
+    cmap for category in NCL_CMAP_CATEGORIES.values() for cmap in category
+)
 
 # Default colormap
 DEFAULT_COLORMAP = 'MPL_GnBu' if 'MPL_GnBu' in ALL_NCL_CMAPS else ALL_NCL_CMAPS[0]
@@ -93,7 +103,7 @@ DEFAULT_COLORMAP = 'MPL_GnBu' if 'MPL_GnBu' in ALL_NCL_CMAPS else ALL_NCL_CMAPS[
 # Variable-Specific Default Settings
 # =============================================================================
 
-VARIABLE_DEFAULTS: Dict[str, Dict[str, Any]] = {
+_VARIABLE_DEFAULTS: Dict[str, Dict[str, Any]] = {
     # Outgoing longwave radiation
     'olr': {
         'cmap': 'MPL_GnBu',
@@ -102,7 +112,8 @@ VARIABLE_DEFAULTS: Dict[str, Dict[str, Any]] = {
 
     # Surface precipitation
     'sprec': {
-        'cmap': 'precip3_16lev'
+        'cmap': 'precip3_16lev',
+        'precision_sensitive': True
     },
 
     # Wind components (u, v, w) - use diverging colormaps with symmetric range
@@ -133,15 +144,16 @@ VARIABLE_DEFAULTS: Dict[str, Dict[str, Any]] = {
         'symmetric': True
     },
 
-    # Hydrometeor variables
-    'brim': {'cmap': 'precip3_16lev'},
-    'qc': {'cmap': 'precip3_16lev'},
-    'qi': {'cmap': 'precip3_16lev'},
-    'qr': {'cmap': 'precip3_16lev'},
-    'qrim': {'cmap': 'precip3_16lev'},
-    'nc': {'cmap': 'precip3_16lev'},
-    'ni': {'cmap': 'precip3_16lev'},
-    'nr': {'cmap': 'precip3_16lev'},
+    # Hydrometeor variables (tiny mixing ratios / huge number concentrations
+    # do not survive float16 cache quantization)
+    'brim': {'cmap': 'precip3_16lev', 'precision_sensitive': True},
+    'qc': {'cmap': 'precip3_16lev', 'precision_sensitive': True},
+    'qi': {'cmap': 'precip3_16lev', 'precision_sensitive': True},
+    'qr': {'cmap': 'precip3_16lev', 'precision_sensitive': True},
+    'qrim': {'cmap': 'precip3_16lev', 'precision_sensitive': True},
+    'nc': {'cmap': 'precip3_16lev', 'precision_sensitive': True},
+    'ni': {'cmap': 'precip3_16lev', 'precision_sensitive': True},
+    'nr': {'cmap': 'precip3_16lev', 'precision_sensitive': True},
 
     # Water vapor
     'qv': {'cmap': 'MPL_GnBu'},
@@ -159,8 +171,8 @@ VARIABLE_DEFAULTS: Dict[str, Dict[str, Any]] = {
 
     # Column-integrated variables
     'cwv': {'cmap': 'GMT_drywet'},
-    'iwp': {'cmap': 'precip3_16lev'},
-    'lwp': {'cmap': 'precip3_16lev'},
+    'iwp': {'cmap': 'precip3_16lev', 'precision_sensitive': True},
+    'lwp': {'cmap': 'precip3_16lev', 'precision_sensitive': True},
 
     # Other variables
     'hm': {'cmap': 'MPL_jet'},
@@ -174,6 +186,17 @@ VARIABLE_DEFAULTS: Dict[str, Dict[str, Any]] = {
     'terrain_height': {'cmap': 'OceanLakeLandSnow'}
 }
 
+# Frozen at import (both the table and each entry are read-only)
+VARIABLE_DEFAULTS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    var_name: MappingProxyType(defaults) for var_name, defaults in _VARIABLE_DEFAULTS.items()
+})
+
+# Wildcard entries (e.g. 'tr*'), compiled once, in table order
+_WILDCARD_DEFAULTS: List[Tuple[re.Pattern, Mapping[str, Any]]] = [
+    (re.compile(fnmatch.translate(pattern)), defaults)
+    for pattern, defaults in VARIABLE_DEFAULTS.items() if '*' in pattern
+]
+
 
 # =============================================================================
 # Colormap Lookup Functions
@@ -197,6 +220,8 @@ def get_variable_default(var_name: str) -> Dict[str, Any]:
         - 'cmap': Colormap name
         - 'reverse': Whether to reverse the colormap (optional)
         - 'symmetric': Whether to use symmetric color limits (optional)
+        - 'precision_sensitive': Keep full precision in the frame cache
+          (optional)
 
     Examples
     --------
@@ -211,17 +236,19 @@ def get_variable_default(var_name: str) -> Dict[str, Any]:
     'WhiteBlueGreenYellowRed'
     """
     # Direct match
-    if var_name in VARIABLE_DEFAULTS:
-        return VARIABLE_DEFAULTS[var_name].copy()
+    defaults = VARIABLE_DEFAULTS.get(var_name)
+    if defaults is not None:
+        return dict(defaults)
 
     # Wildcard match
-    for pattern, defaults in VARIABLE_DEFAULTS.items():
-        if '*' in pattern and fnmatch.fnmatch(var_name, pattern):
-            return defaults.copy()
+    for pattern, defaults in _WILDCARD_DEFAULTS:
+        if pattern.match(var_name):
+            return dict(defaults)
 
     return {}
 
 
+@lru_cache(maxsize=256)
 def resolve_colormap(
     cmap_name: str,
     reverse: bool = False
@@ -234,6 +261,10 @@ def resolve_colormap(
     2. Matplotlib colormap lookup
     3. Colormap reversal
 
+    Results are memoized per (cmap_name, reverse); the returned colormap is
+    shared between callers and must not be modified (``cache_clear()``
+    resets the cache).
+
     Parameters
     ----------
     cmap_name : str
@@ -310,7 +341,7 @@ def get_colormap_categories() -> Dict[str, List[str]]:
     >>> 'MPL_jet' in categories['Rainbow']
     True
     """
-    return NCL_CMAP_CATEGORIES.copy()
+    return {category: list(cmap_names) for category, cmap_names in NCL_CMAP_CATEGORIES.items()}
 
 
 def get_all_colormaps() -> List[str]:
@@ -328,4 +359,4 @@ def get_all_colormaps() -> List[str]:
     >>> 'WhiteBlueGreenYellowRed' in all_cmaps
     True
     """
-    return ALL_NCL_CMAPS.copy()
+    return list(ALL_NCL_CMAPS)
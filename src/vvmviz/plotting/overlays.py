@@ -8,26 +8,165 @@ This module provides overlay rendering functionality for VVMViz:
 """
 
 import logging
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 import numpy as np
 import xarray as xr
 import holoviews as hv
 import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
+from contourpy import contour_generator, LineType
 
-try:
-    import hvplot.xarray  # noqa: F401 - Required for xr.DataArray.hvplot
-except ImportError:
-    pass
+from vvmviz.plotting.base import nan_minmax
+from vvmviz.utils.jit import HAS_NUMBA, njit, prange, FASTMATH, PARALLEL_MIN_SIZE
 
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# Wind Kernels
+# =============================================================================
+
+@njit(cache=True, fastmath=FASTMATH)
+def _subsample_vectors_jit(lons, lats, u, v, skip_x, skip_y):
+    ny = (u.shape[0] + skip_y - 1) // skip_y
+    nx = (u.shape[1] + skip_x - 1) // skip_x
+    n = ny * nx
+    xs = np.empty(n)
+    ys = np.empty(n)
+    angle = np.empty(n)
+    mag = np.empty(n)
+
+    for j in range(ny):
+        jj = j * skip_y
+        for i in range(nx):
+            ii = i * skip_x
+            k = j * nx + i
+            uu = u[jj, ii]
+            vv = v[jj, ii]
+            xs[k] = lons[ii]
+            ys[k] = lats[jj]
+            mag[k] = np.sqrt(uu * uu + vv * vv)
+            angle[k] = np.arctan2(vv, uu)
+
+    return xs, ys, angle, mag
+
+
+def subsample_vectors(
+    lons: np.ndarray,
+    lats: np.ndarray,
+    u: np.ndarray,
+    v: np.ndarray,
+    skip_x: int,
+    skip_y: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Subsample a 2D wind field into flat arrow arrays.
+
+    Parameters
+    ----------
+    lons, lats : np.ndarray
+        1D coordinates along the last and first axis of u/v
+    u, v : np.ndarray
+        2D wind components (lat, lon)
+    skip_x, skip_y : int
+        Stride along lon and lat
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (x, y, angle, magnitude), flattened row-major. Masked points have
+        NaN magnitude.
+    """
+    if HAS_NUMBA:
+        return _subsample_vectors_jit(lons, lats, u, v, skip_x, skip_y)
+
+    u = u[::skip_y, ::skip_x]
+    v = v[::skip_y, ::skip_x]
+    lons = lons[::skip_x]
+    lats = lats[::skip_y]
+    return (np.tile(lons, len(lats)), np.repeat(lats, len(lons)),
+            np.arctan2(v, u).ravel(), np.hypot(u, v).ravel())
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _speed_direction_row(j, u, v, speed, direction):
+    for i in range(u.shape[1]):
+        uu = u[j, i]
+        vv = v[j, i]
+        speed[j, i] = np.sqrt(uu * uu + vv * vv)
+        direction[j, i] = (270.0 - np.arctan2(vv, uu) * (180.0 / np.pi)) % 360.0
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _speed_direction_jit(u, v):
+    speed = np.empty(u.shape)
+    direction = np.empty(u.shape)
+    for j in range(u.shape[0]):
+        _speed_direction_row(j, u, v, speed, direction)
+    return speed, direction
+
+
+@njit(cache=True, fastmath=FASTMATH, parallel=True)
+def _speed_direction_parallel(u, v):
+    speed = np.empty(u.shape)
+    direction = np.empty(u.shape)
+    for j in prange(u.shape[0]):
+        _speed_direction_row(j, u, v, speed, direction)
+    return speed, direction
+
+
+def wind_speed_direction(u: np.ndarray, v: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute wind speed and meteorological direction on a 2D grid.
+
+    Parameters
+    ----------
+    u, v : np.ndarray
+        2D wind components
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (speed in m/s, direction in degrees the wind blows from)
+    """
+    if HAS_NUMBA and u.ndim == 2:
+        if u.size > PARALLEL_MIN_SIZE:
+            return _speed_direction_parallel(u, v)
+        return _speed_direction_jit(u, v)
+
+    # One temporary for the direction, transformed in place
+    speed = np.hypot(u, v)
+    direction = np.arctan2(v, u)
+    np.multiply(direction, -180.0 / np.pi, out=direction)
+    np.add(direction, 270.0, out=direction)
+    np.mod(direction, 360.0, out=direction)
+    return speed, direction
+
+
 # =============================================================================
 # Wind Vector Overlay
 # =============================================================================
 
+def _range_slice(values: np.ndarray, value_range: Tuple[float, float]) -> slice:
+    """
+    Index slice of a monotonic 1D grid coordinate within [lo, hi].
+
+    Found by binary search, so isel returns a view instead of copying
+    through a boolean mask.
+    """
+    lo, hi = value_range
+    n = len(values)
+    if n > 1 and values[0] > values[-1]:
+        # Descending: search the reversed view, then map back
+        rev = values[::-1]
+        return slice(n - np.searchsorted(rev, hi, side='right'),
+                     n - np.searchsorted(rev, lo, side='left'))
+    return slice(np.searchsorted(values, lo, side='left'),
+                 np.searchsorted(values, hi, side='right'))
+
+
 def create_wind_vectors(
     u_da: xr.DataArray,
     v_da: xr.DataArray,
@@ -83,82 +222,61 @@ def create_wind_vectors(
         ang_view = angle_rad
 
         if x_range is not None:
-            lon_vals = u_da[lon_dim].values
-            mask_lon = (lon_vals >= x_range[0]) & (lon_vals <= x_range[1])
-            u_view = u_view.isel({lon_dim: mask_lon})
-            v_view = v_view.isel({lon_dim: mask_lon})
-            if mag_view is not None: mag_view = mag_view.isel({lon_dim: mask_lon})
-            if ang_view is not None: ang_view = ang_view.isel({lon_dim: mask_lon})
+            sel_lon = _range_slice(u_da[lon_dim].values, x_range)
+            u_view = u_view.isel({lon_dim: sel_lon})
+            v_view = v_view.isel({lon_dim: sel_lon})
+            if mag_view is not None: mag_view = mag_view.isel({lon_dim: sel_lon})
+            if ang_view is not None: ang_view = ang_view.isel({lon_dim: sel_lon})
 
         if y_range is not None:
-            lat_vals = u_da[lat_dim].values
-            mask_lat = (lat_vals >= y_range[0]) & (lat_vals <= y_range[1])
-            u_view = u_view.isel({lat_dim: mask_lat})
-            v_view = v_view.isel({lat_dim: mask_lat})
-            if mag_view is not None: mag_view = mag_view.isel({lat_dim: mask_lat})
-            if ang_view is not None: ang_view = ang_view.isel({lat_dim: mask_lat})
+            sel_lat = _range_slice(u_da[lat_dim].values, y_range)
+            u_view = u_view.isel({lat_dim: sel_lat})
+            v_view = v_view.isel({lat_dim: sel_lat})
+            if mag_view is not None: mag_view = mag_view.isel({lat_dim: sel_lat})
+            if ang_view is not None: ang_view = ang_view.isel({lat_dim: sel_lat})
 
         # Compute downsampling skip factors
         skip_x = max(1, u_view.sizes.get(lon_dim, 1) // arrow_density)
         skip_y = max(1, u_view.sizes.get(lat_dim, 1) // arrow_density)
 
-        # Downsample Coordinates
-        u_down = u_view.isel({
-            lon_dim: slice(None, None, skip_x),
-            lat_dim: slice(None, None, skip_y)
-        })
-        
-        # Compute or Downsample Magnitude/Angle
-        if mag_view is not None:
-            mag = mag_view.isel({
-                lon_dim: slice(None, None, skip_x),
-                lat_dim: slice(None, None, skip_y)
-            })
+        if mag_view is None and ang_view is None:
+            x_flat, y_flat, angle_flat, mag_flat = subsample_vectors(
+                u_view[lon_dim].values,
+                u_view[lat_dim].values,
+                np.asarray(u_view.values),
+                np.asarray(v_view.values),
+                skip_x, skip_y
+            )
         else:
-            # Need u, v downsampled to compute
-            v_down = v_view.isel({
-                lon_dim: slice(None, None, skip_x),
-                lat_dim: slice(None, None, skip_y)
-            })
-            mag = np.sqrt(u_down**2 + v_down**2)
-
-        if ang_view is not None:
-            angle = ang_view.isel({
+            down = {
                 lon_dim: slice(None, None, skip_x),
                 lat_dim: slice(None, None, skip_y)
-            })
-        else:
-            # Re-use v_down if computed above, else compute
-            if 'v_down' not in locals():
-                v_down = v_view.isel({
-                    lon_dim: slice(None, None, skip_x),
-                    lat_dim: slice(None, None, skip_y)
-                })
-            angle = np.arctan2(v_down, u_down)
-
-        # Extract coordinate values
-        lons = u_down[lon_dim].values
-        lats = u_down[lat_dim].values
-
-        # Prepare columnar data for HoloViews
-        xx, yy = np.meshgrid(lons, lats)
-        x_flat = xx.flatten()
-        y_flat = yy.flatten()
-        angle_flat = angle.values.flatten()
-        mag_flat = mag.values.flatten()
-
-        # Filter out NaN values
-        valid = ~np.isnan(mag_flat)
-        if not np.any(valid):
+            }
+            u_down = u_view.isel(down)
+            v_down = v_view.isel(down)
+            mag = mag_view.isel(down) if mag_view is not None else np.hypot(u_down, v_down)
+            angle = ang_view.isel(down) if ang_view is not None else np.arctan2(v_down, u_down)
+
+            # Prepare columnar data for HoloViews (row-major grid points)
+            lons = u_down[lon_dim].values
+            lats = u_down[lat_dim].values
+            x_flat = np.tile(lons, len(lats))
+            y_flat = np.repeat(lats, len(lons))
+            angle_flat = np.asarray(angle.values).ravel()
+            mag_flat = np.asarray(mag.values).ravel()
+
+        # Filter out NaN values (one index array, gathered into all columns)
+        idx = np.flatnonzero(~np.isnan(mag_flat))
+        if idx.size == 0:
             logger.warning("No valid wind vectors after filtering NaNs")
             return None
 
-        vector_data = (
-            x_flat[valid],
-            y_flat[valid],
-            angle_flat[valid],
-            mag_flat[valid]
-        )
+        if idx.size == mag_flat.size:
+            vector_data = (x_flat, y_flat, angle_flat, mag_flat)
+        else:
+            vector_data = tuple(
+                np.take(column, idx) for column in (x_flat, y_flat, angle_flat, mag_flat)
+            )
 
         # Create VectorField
         vector_plot = hv.VectorField(
@@ -173,7 +291,8 @@ def create_wind_vectors(
             active_tools=[]
         )
 
-        logger.debug(f"Created wind vector field with {np.sum(valid)} arrows")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Created wind vector field with {idx.size} arrows")
         return vector_plot
 
     except Exception as e:
@@ -185,6 +304,29 @@ def create_wind_vectors(
 # Contour Overlay
 # =============================================================================
 
+@lru_cache(maxsize=64)
+def _hex_palette(cmap_name: str, n: int) -> Tuple[str, ...]:
+    """n hex colors evenly spaced over a colormap (one per contour level)."""
+    try:
+        cmap = plt.get_cmap(cmap_name)
+    except Exception as e:
+        logger.warning(f"Failed to load colormap {cmap_name}, using 'viridis': {e}")
+        cmap = plt.get_cmap('viridis')
+
+    return tuple(mcolors.to_hex(cmap(i / (n - 1 or 1))) for i in range(n))
+
+
+def _level_labels(levels) -> List[str]:
+    """Legend labels for contour levels, formatted by magnitude."""
+    levels = np.asarray(levels, dtype=float)
+    magnitude = np.abs(levels)
+    formats = np.where(
+        (magnitude < 0.01) & (magnitude > 0), '%.2e',
+        np.where(magnitude < 1, '%.3f', '%.1f')
+    )
+    return [str(fmt) % lvl for fmt, lvl in zip(formats, levels.tolist())]
+
+
 def create_contour_overlay(
     da: xr.DataArray,
     num_levels: int = 10,
@@ -242,9 +384,13 @@ def create_contour_overlay(
         lon_dim = 'lon' if 'lon' in da.dims else da.dims[-1]
         lat_dim = 'lat' if 'lat' in da.dims else da.dims[0]
 
+        # Field on a (lat, lon) grid; NaN points (terrain) are masked
+        x = np.asarray(da[lon_dim].values)
+        y = np.asarray(da[lat_dim].values)
+        z = np.asarray(da.transpose(lat_dim, lon_dim).values)
+
         # Calculate value range
-        data_min = float(da.min().values)
-        data_max = float(da.max().values)
+        data_min, data_max = nan_minmax(z)
 
         if vmin is None:
             vmin = data_min
@@ -264,49 +410,29 @@ def create_contour_overlay(
             logger.warning("No contour levels generated")
             return None
 
-        # Get colormap
-        try:
-            cmap = plt.get_cmap(cmap_name)
-        except Exception as e:
-            logger.warning(f"Failed to load colormap {cmap_name}, using 'viridis': {e}")
-            cmap = plt.get_cmap('viridis')
+        # Levels are evenly spaced, so level i takes palette color i
+        colors = _hex_palette(cmap_name, len(levels))
 
-        # Normalize colors to levels range
-        norm = mcolors.Normalize(vmin=min(levels), vmax=max(levels))
+        # One contour tracer for all levels
+        generator = contour_generator(
+            x, y, np.ma.masked_invalid(z), line_type=LineType.Separate
+        )
 
         # Create individual contour layers (one per level for interactive legend)
         contour_layers = []
-        for lvl in levels:
-            # Get color for this level
-            val = norm(lvl)
-            color = mcolors.to_hex(cmap(val))
-
-            # Format label based on magnitude
-            if abs(lvl) < 0.01 and abs(lvl) > 0:
-                label = f"{lvl:.2e}"
-            elif abs(lvl) < 1:
-                label = f"{lvl:.3f}"
-            else:
-                label = f"{lvl:.1f}"
-
+        for lvl, color, label in zip(levels, colors, _level_labels(levels)):
             # Create contour layer for this level
             try:
-                layer = da.hvplot.contour(
-                    x=lon_dim,
-                    y=lat_dim,
-                    levels=[lvl],
-                    cmap=[color],
-                    line_width=line_width,
-                    hover=False,
-                    dynamic=False,
-                    rasterize=False,
-                    framewise=False,
-                    aspect='equal',
-                    colorbar=False,
-                    label=label,
-                    legend=True
+                paths = [
+                    {lon_dim: line[:, 0], lat_dim: line[:, 1]}
+                    for line in generator.lines(lvl)
+                ]
+                layer = hv.Contours(
+                    paths, kdims=[lon_dim, lat_dim], label=label
                 ).opts(
                     color=color,
+                    line_width=line_width,
+                    show_legend=True,
                     muted_alpha=0.1  # Faded when muted via legend click
                 )
                 contour_layers.append(layer)
@@ -399,3 +525,21 @@ def get_town_boundaries(color: str = 'gray', line_width: float = 0.5) -> hv.Path
     paths = load_boundary_paths(TWTOWN_SHP_PATH, cache_key, color, line_width)
     # Remove hover tool for overlay use
     return paths.opts(tools=[], active_tools=[])
+
+
+def preload_boundaries() -> None:
+    """
+    Parse the Taiwan boundary shapefiles into the process-wide cache.
+
+    Call in the server parent before workers fork (see app.prewarm) so the
+    vertex arrays are shared copy-on-write rather than parsed per worker.
+    Missing shapefiles are logged and skipped.
+    """
+    from vvmviz.config import TWCOUNTY_SHP_PATH, TWTOWN_SHP_PATH
+    from vvmviz.utils.shapefile import read_boundary_vertices
+
+    for shp_path in (TWCOUNTY_SHP_PATH, TWTOWN_SHP_PATH):
+        try:
+            read_boundary_vertices(shp_path)
+        except (FileNotFoundError, RuntimeError) as e:
+            logger.warning(f"Boundary preload skipped: {e}")
@@ -13,7 +13,6 @@ The state is centralized here to:
 import logging
 
 import param
-import holoviews as hv
 
 logger = logging.getLogger(__name__)
 
@@ -52,11 +51,18 @@ class AppState(param.Parameterized):
         Flag to skip range extraction during reset
     lev_vals : array or None
         Cached vertical level values for index lookup
+    lev_sorted, lev_order : array or None
+        lev_vals sorted ascending, and the lev_vals position of each entry
+    sim_meta : SimMeta or None
+        Metadata of the current simulation (see core.scan_simulation)
+    time_index_array : np.ndarray or None
+        Sorted available time indices, for binary-search range lookups
     """
 
     # Simulation info
     current_sim_path = param.String(default=None, allow_None=True)
     variable_groups = param.Dict(default={})
+    sim_meta = param.Parameter(default=None)
     
     # Plot reference
     last_plot_object = param.Parameter(default=None)
@@ -79,26 +85,26 @@ class AppState(param.Parameterized):
     
     # Vertical levels cache
     lev_vals = param.Parameter(default=None)
+    lev_sorted = param.Parameter(default=None)
+    lev_order = param.Parameter(default=None)
     
     # Time index mapping (slider position -> actual file index)
     time_index_map = param.Dict(default={})
     available_time_indices = param.List(default=[])
+    time_index_array = param.Parameter(default=None)  # sorted np.ndarray
 
 
 # =============================================================================
 # Range Tracking
 # =============================================================================
 
-# Global RangeXY stream to persist zoom/pan across updates
-range_stream = hv.streams.RangeXY()
-
-
 def create_range_recorder(app_state: AppState):
     """
     Create a callback to persist user zoom/pan ranges to app_state.
 
-    This callback is subscribed to the range_stream and updates app_state
-    whenever the user zooms or pans on the plot.
+    This callback is subscribed to a session's RangeXY stream and updates
+    app_state whenever the user zooms or pans on the plot. Events are ignored
+    while ``app_state.skip_range_extraction`` is set (view reset in progress).
 
     Parameters
     ----------
@@ -111,6 +117,9 @@ def create_range_recorder(app_state: AppState):
         The callback function
     """
     def record_ranges(**ranges):
+        if app_state.skip_range_extraction:
+            return
+
         xr = ranges.get('x_range')
         yr = ranges.get('y_range')
 
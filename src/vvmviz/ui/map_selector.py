@@ -12,7 +12,7 @@ import numpy as np
 import panel as pn
 import holoviews as hv
 
-from vvmviz.config import FILE_IO_LOCK
+from vvmviz.config import get_file_lock
 from vvmviz.core.data_loader import get_terrain_data
 
 logger = logging.getLogger(__name__)
@@ -142,7 +142,7 @@ class DomainMapSelector:
         """
         try:
             # Load terrain data
-            with FILE_IO_LOCK:
+            with get_file_lock(sim_path):
                 terrain_da = get_terrain_data(sim_path)
 
             if terrain_da is None:
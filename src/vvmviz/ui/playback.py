@@ -95,6 +95,12 @@ class PlaybackController(param.Parameterized):
         self.next_button = next_button
         self.speed_slider = speed_slider
 
+        # Slider option values and their positions, rebuilt only when the
+        # slider gets a new options object
+        self._options_ref = None
+        self._option_values: tuple = ()
+        self._option_pos: dict = {}
+
         # Connect button callbacks
         self.play_button.on_click(self.toggle_play)
 
@@ -145,6 +151,37 @@ class PlaybackController(param.Parameterized):
             self.session_id += 1  # Kill any pending loops
             logger.debug("Playback paused")
 
+    def _options(self):
+        """Return (option values, value -> position) for the time slider."""
+        options = self.time_slider.options
+        if options is not self._options_ref:
+            values = tuple(options.values()) if isinstance(options, dict) else tuple(options)
+            self._option_values = values
+            self._option_pos = {v: i for i, v in enumerate(values)}
+            self._options_ref = options
+        return self._option_values, self._option_pos
+
+    def _step(self, offset: int) -> None:
+        """
+        Move the time slider by offset options (wrapping around).
+
+        A value not in the options resets to the first option (stepping
+        forward) or the last one (stepping backward).
+        """
+        values, positions = self._options()
+        if not values:
+            return
+
+        idx = positions.get(self.time_slider.value)
+        if idx is None:
+            self.time_slider.value = values[0] if offset > 0 else values[-1]
+            logger.debug("Reset to first/last time step")
+            return
+
+        new_idx = (idx + offset) % len(values)
+        self.time_slider.value = values[new_idx]
+        logger.debug(f"Moved to time index {new_idx}")
+
     def _step_internal(self, run_id: int):
         """
         Internal step function called by periodic callback.
@@ -176,23 +213,13 @@ class PlaybackController(param.Parameterized):
             return
 
         # Get available time options
-        options = list(self.time_slider.options.values())
-        if not options:
+        if not self._options()[0]:
             logger.warning("No time options available")
             self.stop()
             return
 
         # Advance to next time step
-        current = self.time_slider.value
-        try:
-            idx = options.index(current)
-            next_idx = (idx + 1) % len(options)
-            self.time_slider.value = options[next_idx]
-            logger.debug(f"Advanced to time index {next_idx}")
-        except ValueError:
-            # Current value not in options, reset to start
-            self.time_slider.value = options[0]
-            logger.debug("Reset to first time step")
+        self._step(1)
 
         # Schedule next step (with same run_id to maintain session)
         if self.playing:
@@ -226,18 +253,7 @@ class PlaybackController(param.Parameterized):
         if not self.time_slider.visible:
             return
 
-        options = list(self.time_slider.options.values())
-        if not options:
-            return
-
-        current = self.time_slider.value
-        try:
-            idx = options.index(current)
-            next_idx = (idx + 1) % len(options)
-            self.time_slider.value = options[next_idx]
-            logger.debug(f"Stepped forward to index {next_idx}")
-        except ValueError:
-            self.time_slider.value = options[0]
+        self._step(1)
 
     def step_backward(self, event=None):
         """
@@ -251,18 +267,7 @@ class PlaybackController(param.Parameterized):
         if not self.time_slider.visible:
             return
 
-        options = list(self.time_slider.options.values())
-        if not options:
-            return
-
-        current = self.time_slider.value
-        try:
-            idx = options.index(current)
-            prev_idx = (idx - 1) % len(options)
-            self.time_slider.value = options[prev_idx]
-            logger.debug(f"Stepped backward to index {prev_idx}")
-        except ValueError:
-            self.time_slider.value = options[-1]
+        self._step(-1)
 
 
 # =============================================================================
@@ -265,7 +265,7 @@ def create_colormap_gallery() -> Tuple[pn.widgets.Select, pn.Column, pn.widgets.
     # Hidden selector to hold value
     cmap_selector = pn.widgets.Select(
         name='Colormap',
-        options=ALL_NCL_CMAPS,
+        options=list(ALL_NCL_CMAPS),
         value=DEFAULT_COLORMAP,
         visible=False
     )
@@ -2,27 +2,79 @@
 VVMViz Utilities
 
 Utility functions and classes for caching, metadata formatting,
-and shapefile handling.
+shapefile handling and optional JIT compilation.
 """
 
-from vvmviz.utils.cache import CacheManager, FrameRequest, get_cache_manager
-from vvmviz.utils.metadata import (
-    format_time_value,
-    extract_metadata_from_dataarray,
-    build_metadata_markdown,
-    format_data_size,
-    summarize_dataset
-)
-from vvmviz.utils.shapefile import (
-    load_boundary_paths,
-    validate_shapefile
-)
+# Submodules are imported lazily (PEP 562): the data layer imports
+# vvmviz.utils.sized_lru, which must not pull in HoloViews via shapefile.
+# sized_lru itself is imported eagerly: the decorator shares its name with
+# the submodule, which importing the submodule would bind here instead.
+from vvmviz.utils.sized_lru import SizedLRU, sized_lru
+
+_LAZY_IMPORTS = {
+    # Cache
+    'CacheManager': 'vvmviz.utils.cache',
+    'FrameRequest': 'vvmviz.utils.cache',
+    'EvictionPolicy': 'vvmviz.utils.cache',
+    'LRUPolicy': 'vvmviz.utils.cache',
+    'FIFOPolicy': 'vvmviz.utils.cache',
+    'NoEvictionPolicy': 'vvmviz.utils.cache',
+    'get_cache_manager': 'vvmviz.utils.cache',
+    # I/O process pool
+    'run_in_pool': 'vvmviz.utils.io_pool',
+    'shutdown_io_pool': 'vvmviz.utils.io_pool',
+    # Throttling
+    'AdaptiveThrottle': 'vvmviz.utils.throttle',
+    # JIT
+    'HAS_NUMBA': 'vvmviz.utils.jit',
+    'njit': 'vvmviz.utils.jit',
+    # Metadata
+    'format_time_value': 'vvmviz.utils.metadata',
+    'extract_metadata_from_dataarray': 'vvmviz.utils.metadata',
+    'build_metadata_markdown': 'vvmviz.utils.metadata',
+    'format_data_size': 'vvmviz.utils.metadata',
+    'summarize_dataset': 'vvmviz.utils.metadata',
+    # Shapefile
+    'load_boundary_paths': 'vvmviz.utils.shapefile',
+    'read_boundary_vertices': 'vvmviz.utils.shapefile',
+    'validate_shapefile': 'vvmviz.utils.shapefile',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Cache
     'CacheManager',
     'FrameRequest',
+    'EvictionPolicy',
+    'LRUPolicy',
+    'FIFOPolicy',
+    'NoEvictionPolicy',
     'get_cache_manager',
+    'SizedLRU',
+    'sized_lru',
+    # I/O process pool
+    'run_in_pool',
+    'shutdown_io_pool',
+    # Throttling
+    'AdaptiveThrottle',
+    # JIT
+    'HAS_NUMBA',
+    'njit',
     # Metadata
     'format_time_value',
     'extract_metadata_from_dataarray',
@@ -31,5 +83,6 @@ __all__ = [
     'summarize_dataset',
     # Shapefile
     'load_boundary_paths',
+    'read_boundary_vertices',
     'validate_shapefile',
 ]
@@ -11,11 +11,16 @@ Provides a unified caching system for VVMViz with:
 
 import threading
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, Any, Tuple, Optional, Callable
+from typing import Any, Dict, Tuple, Optional, Callable
 from concurrent.futures import ThreadPoolExecutor, Future
 from time import time
 
+import numpy as np
+
+from vvmviz.utils.sized_lru import estimate_nbytes
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,13 +28,14 @@ logger = logging.getLogger(__name__)
 # Data Structures
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True)
 class FrameRequest:
     """
     Specification for loading a single frame of data.
 
     This encapsulates all parameters needed to load and cache a frame,
-    including the main variable and overlay configurations.
+    including the main variable and overlay configurations. Requests are
+    immutable and hashable, so identical requests compare equal.
     """
     sim_path: str
     var_name: str
@@ -48,16 +54,22 @@ class FrameRequest:
         """
         Generate cache key for this request.
 
-        The cache key identifies a unique frame based on variable and ranges.
-        Overlay settings are not included in the key as they are part of the
-        cached bundle.
+        The cache key identifies a unique frame bundle: the simulation,
+        variable and ranges, plus the overlay settings that determine which
+        layers the bundle contains.
 
         Returns
         -------
         tuple
-            Cache key: (var_name, t_range, z_range)
+            Cache key: (sim_path, var_name, t_range, z_range, x_range,
+            y_range, wind_enabled, use_surface, contour_enabled, contour_var)
         """
-        return (self.var_name, self.t_range, self.z_range)
+        return (
+            self.sim_path, self.var_name, self.t_range, self.z_range,
+            self.x_range, self.y_range,
+            self.wind_enabled, self.use_surface,
+            self.contour_enabled, self.contour_var
+        )
 
 
 @dataclass
@@ -110,6 +122,79 @@ class CacheMetrics:
         )
 
 
+# =============================================================================
+# Eviction Policies
+# =============================================================================
+
+class EvictionPolicy:
+    """
+    Decides which frame the CacheManager evicts when it is over budget.
+
+    The cache calls the hooks under its lock; a policy only tracks keys.
+    Subclasses override the hooks they need.
+    """
+
+    name = 'base'
+
+    def on_insert(self, key: Tuple) -> None:
+        """A key was added to the cache."""
+
+    def on_access(self, key: Tuple) -> None:
+        """A cached key was read."""
+
+    def on_remove(self, key: Tuple) -> None:
+        """A key left the cache (eviction or replacement)."""
+
+    def select_for_eviction(self) -> Optional[Tuple]:
+        """Return the key to evict next, or None to refuse the insert."""
+        return None
+
+
+class FIFOPolicy(EvictionPolicy):
+    """Evict the oldest inserted frame; reads do not refresh entries."""
+
+    name = 'fifo'
+
+    def __init__(self):
+        self._order: 'OrderedDict[Tuple, None]' = OrderedDict()
+
+    def on_insert(self, key: Tuple) -> None:
+        self._order[key] = None
+
+    def on_remove(self, key: Tuple) -> None:
+        self._order.pop(key, None)
+
+    def select_for_eviction(self) -> Optional[Tuple]:
+        return next(iter(self._order), None)
+
+
+class LRUPolicy(FIFOPolicy):
+    """Evict the least recently used frame (suits back-and-forth scrubbing)."""
+
+    name = 'lru'
+
+    def on_access(self, key: Tuple) -> None:
+        self._order.move_to_end(key)
+
+
+class NoEvictionPolicy(EvictionPolicy):
+    """Never evict; new frames are not cached once the budget is full."""
+
+    name = 'none'
+
+
+EVICTION_POLICIES: Dict[str, type] = {
+    policy.name: policy for policy in (LRUPolicy, FIFOPolicy, NoEvictionPolicy)
+}
+
+
+def bundle_nbytes(bundle: Any) -> int:
+    """Estimate the memory held by a cached frame bundle."""
+    if hasattr(bundle, 'layers'):
+        return sum(int(f.nbytes) for f in bundle.layers())
+    return estimate_nbytes(bundle)
+
+
 # =============================================================================
 # Cache Manager
 # =============================================================================
@@ -119,14 +204,21 @@ class CacheManager:
     Unified cache manager for VVMViz data.
 
     This class manages a two-layer caching system:
-    1. Dataset cache: Handled by @lru_cache decorator on load functions
-    2. Frame cache: Manual LRU cache for computed frame bundles
+    1. Dataset cache: Handled by the @sized_lru decorator on open_dataset
+    2. Frame cache: computed frame bundles, bounded by entry count and bytes
+       with a pluggable eviction policy (LRU by default)
 
     The frame cache stores complete data bundles including:
     - Main variable (computed)
     - Wind overlay (if enabled, computed)
     - Contour overlay (if enabled, computed)
 
+    Frames can be stored at reduced precision (``dtype``, e.g. float16) to
+    roughly halve cache memory. Frames of variables flagged
+    ``precision_sensitive`` in VARIABLE_DEFAULTS, or with values outside the
+    dtype's finite range, are stored unchanged. Consumers cast back to
+    float32 at render time.
+
     Thread Safety
     -------------
     All cache operations are protected by a lock to ensure thread safety
@@ -140,24 +232,39 @@ class CacheManager:
         Enable background prefetching (default: True)
     max_workers : int, optional
         Number of prefetch worker threads (default: 1)
+    dtype : str, optional
+        Storage dtype for cached frames (default: None, keep as loaded)
+    policy : str or EvictionPolicy, optional
+        'lru', 'fifo' or 'none', or a policy instance (default: 'lru')
+    max_bytes : int, optional
+        Byte budget for cached frames (default: None, count-bounded only)
     """
 
     def __init__(
         self,
         max_size: int = 200,
         enable_prefetch: bool = True,
-        max_workers: int = 1
+        max_workers: int = 1,
+        dtype: Optional[str] = None,
+        policy: str | EvictionPolicy = 'lru',
+        max_bytes: Optional[int] = None
     ):
         self.max_size = max_size
+        self.max_bytes = max_bytes
         self.enable_prefetch = enable_prefetch
+        self.dtype = np.dtype(dtype) if dtype else None
+        self.policy = EVICTION_POLICIES[policy]() if isinstance(policy, str) else policy
 
-        # Frame cache storage
-        self.frame_cache: Dict[Tuple, Dict[str, Any]] = {}
-        self.frame_cache_keys: list = []  # LRU ordering (oldest to newest)
+        # Frame cache storage: key -> (bundle, nbytes); order is kept by the policy
+        self.frame_cache: Dict[Tuple, Tuple[Any, int]] = {}
+        self.total_bytes = 0
 
         # Thread safety
         self.cache_lock = threading.Lock()
 
+        # Frames being loaded: key -> Event set when the load finishes
+        self._inflight: Dict[Tuple, threading.Event] = {}
+
         # Prefetch management
         self.executor = ThreadPoolExecutor(
             max_workers=max_workers,
@@ -170,74 +277,203 @@ class CacheManager:
 
         logger.info(
             f"CacheManager initialized: max_size={max_size}, "
-            f"prefetch={enable_prefetch}, workers={max_workers}"
+            f"prefetch={enable_prefetch}, workers={max_workers}, "
+            f"dtype={self.dtype}, policy={self.policy.name}, max_bytes={max_bytes}"
         )
 
-    def get(self, key: Tuple) -> Optional[Dict[str, Any]]:
+    def get(self, key: Tuple) -> Optional[Any]:
         """
         Retrieve frame bundle from cache.
 
         Parameters
         ----------
         key : tuple
-            Cache key (var_name, t_range, z_range)
+            Cache key (see FrameRequest.cache_key)
 
         Returns
         -------
-        dict or None
+        FrameBundle or None
             Cached frame bundle if found, None otherwise
-            Bundle contains: {'main': DataArray, 'wind': tuple, 'contour': DataArray}
         """
         with self.cache_lock:
             if key in self.frame_cache:
-                # Cache hit: move key to end (mark as recently used)
-                self.frame_cache_keys.remove(key)
-                self.frame_cache_keys.append(key)
+                # Cache hit: let the policy record the access
+                self.policy.on_access(key)
 
                 self.metrics.hits += 1
                 logger.debug(f"Cache HIT: {key}")
 
-                return self.frame_cache[key]
+                return self.frame_cache[key][0]
             else:
                 # Cache miss
                 self.metrics.misses += 1
                 logger.debug(f"Cache MISS: {key}")
                 return None
 
-    def put(self, key: Tuple, bundle: Dict[str, Any]) -> None:
+    def put(self, key: Tuple, bundle: Any) -> Any:
         """
-        Store frame bundle in cache with LRU eviction.
+        Store frame bundle in cache, evicting per the policy.
+
+        With NoEvictionPolicy a bundle that does not fit is not cached.
 
         Parameters
         ----------
         key : tuple
-            Cache key (var_name, t_range, z_range)
-        bundle : dict
-            Frame bundle to cache
-            Expected keys: 'main', 'wind', 'contour', 't_range', 'z_range', 'main_var'
+            Cache key (see FrameRequest.cache_key)
+        bundle : FrameBundle
+            Frame bundle to cache (see core.data_processor.FrameBundle)
+
+        Returns
+        -------
+        FrameBundle
+            The bundle as stored (quantized if applicable), so the loading
+            caller sees the same data as later cache hits
         """
+        if self.dtype is not None:
+            bundle = self._quantize(bundle)
+
+        nbytes = bundle_nbytes(bundle)
+
         with self.cache_lock:
-            # Update existing key (move to end)
+            # Replace existing entry
             if key in self.frame_cache:
-                self.frame_cache_keys.remove(key)
+                self._remove_locked(key)
 
-            # Evict oldest if cache is full
-            elif len(self.frame_cache) >= self.max_size:
-                oldest_key = self.frame_cache_keys.pop(0)
-                del self.frame_cache[oldest_key]
-                logger.debug(f"Cache EVICT: {oldest_key}")
+            # Evict until the new entry fits
+            while self.frame_cache and self._over_budget_locked(nbytes):
+                victim = self.policy.select_for_eviction()
+                if victim is None:
+                    logger.debug(f"Cache FULL, not caching: {key}")
+                    return bundle
+                self._remove_locked(victim)
+                logger.debug(f"Cache EVICT: {victim}")
 
-            # Insert new entry at end (most recent)
-            self.frame_cache[key] = bundle
-            self.frame_cache_keys.append(key)
+            self.frame_cache[key] = (bundle, nbytes)
+            self.total_bytes += nbytes
+            self.policy.on_insert(key)
 
             logger.debug(f"Cache PUT: {key} (size: {len(self.frame_cache)}/{self.max_size})")
 
+        return bundle
+
+    def _over_budget_locked(self, incoming_bytes: int) -> bool:
+        """Whether adding an entry would exceed the budget; caller holds the lock."""
+        if len(self.frame_cache) >= self.max_size:
+            return True
+        return self.max_bytes is not None and self.total_bytes + incoming_bytes > self.max_bytes
+
+    def _remove_locked(self, key: Tuple) -> None:
+        """Drop an entry; caller must hold the lock."""
+        _, nbytes = self.frame_cache.pop(key)
+        self.total_bytes -= nbytes
+        self.policy.on_remove(key)
+
+    def _quantize(self, bundle: Any) -> Any:
+        """
+        Cast a bundle to the storage dtype if it is safe to do so.
+
+        Returns the bundle unchanged for precision-sensitive variables, for
+        non-float data, when any finite value would overflow the dtype, and
+        when a layer's value range spans fewer than CACHE_QUANTIZE_MIN_STEPS
+        steps of the dtype (or has nonzero values below its normal range).
+        """
+        from vvmviz.config import CACHE_QUANTIZE_MIN_STEPS
+        from vvmviz.plotting.colormaps import get_variable_default
+
+        layers = bundle.layers() if hasattr(bundle, 'layers') else []
+        if not layers or not all(np.issubdtype(f.dtype, np.floating) for f in layers):
+            return bundle
+        if all(f.dtype.itemsize <= self.dtype.itemsize for f in layers):
+            return bundle
+
+        names = [bundle.main_var]
+        if bundle.contour is not None:
+            names.append(bundle.contour.name)
+        if any(get_variable_default(n).get('precision_sensitive') for n in names if n):
+            return bundle
+
+        info = np.finfo(self.dtype)
+        for f in layers:
+            arr = f.values
+            if np.isnan(arr).all():
+                continue
+            vmin, vmax = float(np.nanmin(arr)), float(np.nanmax(arr))
+            if vmax > info.max or vmin < -info.max:
+                logger.debug(f"Cache keeps {bundle.main_var} at {arr.dtype}: out of {self.dtype} range")
+                return bundle
+
+            # Resolution near the largest magnitude must leave enough steps
+            # across the range, and small nonzero values must stay normal
+            step = float(np.spacing(self.dtype.type(max(abs(vmin), abs(vmax)))))
+            smallest = np.nanmin(np.abs(arr[arr != 0])) if (arr != 0).any() else info.tiny
+            if vmax - vmin < CACHE_QUANTIZE_MIN_STEPS * step or smallest < info.tiny:
+                logger.debug(f"Cache keeps {bundle.main_var} at {arr.dtype}: too fine for {self.dtype}")
+                return bundle
+
+        return bundle.astype(self.dtype)
+
+    def get_or_load(
+        self,
+        key: Tuple,
+        load_func: Callable[[], Any],
+        wait: bool = True
+    ) -> Optional[Any]:
+        """
+        Return a cached frame, loading it at most once at a time.
+
+        If another thread is already loading the same key, the caller waits
+        for that load instead of reading the files again (or returns None
+        immediately with ``wait=False``). If that load fails, a waiting
+        caller loads the frame itself.
+
+        Parameters
+        ----------
+        key : tuple
+            Cache key (see FrameRequest.cache_key)
+        load_func : callable
+            Called without arguments to load the bundle on a miss
+        wait : bool, default=True
+            Whether to wait for a load already in progress
+
+        Returns
+        -------
+        FrameBundle or None
+            The bundle, or None if wait=False and the key is being loaded
+        """
+        while True:
+            bundle = self.get(key)
+            if bundle is not None:
+                return bundle
+
+            with self.cache_lock:
+                event = self._inflight.get(key)
+                owner = event is None
+                if owner:
+                    event = self._inflight[key] = threading.Event()
+
+            if owner:
+                break
+            if not wait:
+                return None
+            event.wait()
+
+        try:
+            return self.put(key, load_func())
+        finally:
+            with self.cache_lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+    def contains(self, key: Tuple) -> bool:
+        """Check whether a frame is cached (without counting a hit/miss)."""
+        with self.cache_lock:
+            return key in self.frame_cache
+
     def clear(self) -> None:
         """Clear all cached frames."""
         with self.cache_lock:
-            self.frame_cache.clear()
-            self.frame_cache_keys.clear()
+            for key in list(self.frame_cache):
+                self._remove_locked(key)
             logger.info("Cache cleared")
 
     def size(self) -> int:
@@ -248,7 +484,7 @@ class CacheManager:
     def prefetch_async(
         self,
         request: FrameRequest,
-        load_func: Callable[[FrameRequest], Dict[str, Any]]
+        load_func: Callable[[FrameRequest], Any]
     ) -> Optional[Future]:
         """
         Asynchronously prefetch a frame in the background.
@@ -272,10 +508,10 @@ class CacheManager:
 
         cache_key = request.cache_key()
 
-        # Check if already cached
+        # Check if already cached or being loaded
         with self.cache_lock:
-            if cache_key in self.frame_cache:
-                logger.debug(f"Prefetch skipped (already cached): {cache_key}")
+            if cache_key in self.frame_cache or cache_key in self._inflight:
+                logger.debug(f"Prefetch skipped (cached or loading): {cache_key}")
                 return None
 
         # Cancel previous prefetch if still running
@@ -311,18 +547,12 @@ class CacheManager:
             Cache key
         """
         try:
-            # Check again if already cached (might have been loaded in main thread)
-            with self.cache_lock:
-                if cache_key in self.frame_cache:
-                    return
-
-            # Load the frame bundle
+            # Load unless cached or being loaded elsewhere in the meantime
             start_time = time()
-            bundle = load_func(request)
+            bundle = self.get_or_load(cache_key, lambda: load_func(request), wait=False)
             elapsed = time() - start_time
-
-            # Store in cache
-            self.put(cache_key, bundle)
+            if bundle is None:
+                return
 
             # Update metrics
             self.metrics.prefetch_success += 1
@@ -389,12 +619,15 @@ def get_cache_manager(
     global _default_cache_manager
 
     if _default_cache_manager is None:
-        from vvmviz.config import MAX_FRAME_CACHE_SIZE
+        from vvmviz.config import MAX_FRAME_CACHE_SIZE, config
 
         size = max_size if max_size is not None else MAX_FRAME_CACHE_SIZE
         _default_cache_manager = CacheManager(
             max_size=size,
-            enable_prefetch=enable_prefetch
+            enable_prefetch=enable_prefetch,
+            dtype=config.cache_dtype,
+            policy=config.frame_cache_policy,
+            max_bytes=config.frame_cache_bytes
         )
 
     return _default_cache_manager
@@ -0,0 +1,160 @@
+"""
+Process Pool I/O Module
+
+Optional process pool for frame reads. HDF5 serializes every call within a
+process (see FILE_IO_LOCK), so reader threads never overlap; separate worker
+processes each have their own HDF5 library and read in parallel.
+
+Results are pickled with protocol 5 and their array buffers are passed
+out-of-band through one shared memory segment per call, so large frames do
+not travel through the executor's pipe.
+
+Enabled by ``config.io_workers > 0``; otherwise calls run in-process.
+"""
+
+import atexit
+import pickle
+import logging
+import threading
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Pool Management
+# =============================================================================
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_io_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the shared I/O process pool, creating it on first use.
+
+    Workers are started with forkserver (spawn where unavailable): the
+    server process runs threads, which fork would copy mid-state.
+
+    Returns
+    -------
+    ProcessPoolExecutor or None
+        The pool, or None when config.io_workers is 0
+    """
+    global _pool
+
+    from vvmviz.config import config
+
+    if config.io_workers <= 0:
+        return None
+
+    with _pool_lock:
+        if _pool is None:
+            method = 'forkserver' if 'forkserver' in mp.get_all_start_methods() else 'spawn'
+            _pool = ProcessPoolExecutor(
+                max_workers=config.io_workers,
+                mp_context=mp.get_context(method)
+            )
+            atexit.register(shutdown_io_pool)
+            logger.info(f"I/O process pool started: workers={config.io_workers} ({method})")
+    return _pool
+
+
+def shutdown_io_pool() -> None:
+    """Shut down the I/O process pool (if running)."""
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+# =============================================================================
+# Shared Memory Transfer
+# =============================================================================
+
+def _call_to_shm(
+    func: Callable,
+    args: tuple,
+    kwargs: dict
+) -> Tuple[bytes, Optional[str], List[Tuple[int, int]]]:
+    """
+    Worker side: call func and export the result's buffers to shared memory.
+
+    Returns the pickle payload, the segment name (None if the result had no
+    out-of-band buffers) and the (offset, length) of each buffer.
+    """
+    result = func(*args, **kwargs)
+
+    buffers = []
+    payload = pickle.dumps(result, protocol=5, buffer_callback=buffers.append)
+    raws = [b.raw() for b in buffers]
+    total = sum(r.nbytes for r in raws)
+    if total == 0:
+        return payload, None, []
+
+    # The caller unlinks the segment, so the worker must not track it
+    shm = shared_memory.SharedMemory(create=True, size=total, track=False)
+    spans = []
+    offset = 0
+    try:
+        for raw in raws:
+            shm.buf[offset:offset + raw.nbytes] = raw
+            spans.append((offset, raw.nbytes))
+            offset += raw.nbytes
+    finally:
+        shm.close()
+
+    return payload, shm.name, spans
+
+
+def run_in_pool(func: Callable, *args, **kwargs) -> Any:
+    """
+    Call func in the I/O process pool and return its result.
+
+    Runs func in-process when the pool is disabled. func and its arguments
+    must be picklable (module-level function, plain values).
+
+    The shared memory segment is copied once into a private buffer and
+    unlinked immediately, so no segment outlives the call.
+
+    Parameters
+    ----------
+    func : callable
+        Module-level function to call
+    *args, **kwargs
+        Arguments for func
+
+    Returns
+    -------
+    object
+        func's return value
+    """
+    pool = get_io_pool()
+    if pool is None:
+        return func(*args, **kwargs)
+
+    payload, name, spans = pool.submit(_call_to_shm, func, args, kwargs).result()
+    if name is None:
+        return pickle.loads(payload)
+
+    shm = shared_memory.SharedMemory(name=name, track=False)
+    try:
+        total = spans[-1][0] + spans[-1][1]
+        data = memoryview(bytearray(shm.buf[:total]))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return pickle.loads(payload, buffers=[data[o:o + n] for o, n in spans])
+
+
+__all__ = [
+    'get_io_pool',
+    'shutdown_io_pool',
+    'run_in_pool',
+]
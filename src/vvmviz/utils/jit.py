@@ -0,0 +1,42 @@
+"""
+Optional JIT Compilation Module
+
+Thin shim around Numba so hot grid kernels can be compiled when Numba is
+installed (``pip install vvmviz[perf]``) and fall back to NumPy otherwise.
+Callers check ``HAS_NUMBA`` and dispatch to a vectorized NumPy path when it
+is False; the no-op ``njit`` only keeps kernel definitions importable.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Fast-math flags minus 'nnan'/'ninf': VVM fields use NaN for masked
+# (terrain) points, and kernels must still be able to test for them.
+FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+# Grids with more points than this use the parallel kernel variants
+PARALLEL_MIN_SIZE = 1024 * 1024
+
+
+__all__ = [
+    'HAS_NUMBA',
+    'njit',
+    'prange',
+    'FASTMATH',
+    'PARALLEL_MIN_SIZE',
+]
@@ -5,15 +5,57 @@ Functions for formatting time values, building metadata displays,
 and extracting variable information.
 """
 
+import threading
+import warnings
+from collections import OrderedDict
+from functools import lru_cache
+from string import Template
+
 import numpy as np
 import xarray as xr
-from typing import Dict, Any
+from typing import Dict, Any, Hashable, Optional
+
+
+# =============================================================================
+# Templates
+# =============================================================================
+
+_VARIABLE_TEMPLATE = Template(
+    "- **Variable**: `$name`\n"
+    "- **Long Name**: $long_name\n"
+    "- **Units**: $units\n"
+)
+
+_MAIN_TEMPLATE = Template(
+    "### Variable Metadata\n\n"
+    "$variable"
+    "- **Dimensions**: $dims\n"
+)
+
+_CONTOUR_TEMPLATE = Template(
+    "### Contour Overlay\n\n"
+    "$variable"
+)
+
+
+# Rendered markdown keyed by the caller's frame identity (see
+# build_metadata_markdown's cache_key)
+_MARKDOWN_CACHE_SIZE = 512
+_markdown_cache: 'OrderedDict[Hashable, str]' = OrderedDict()
+_markdown_cache_lock = threading.Lock()
 
 
+# =============================================================================
+# Formatting
+# =============================================================================
+
 def format_time_value(real_t: Any, units: str = "") -> str:
     """
     Format time value for display.
 
+    Results are memoized: the same time axis values recur on every slider
+    tick and across sessions.
+
     Parameters
     ----------
     real_t : Any
@@ -26,6 +68,20 @@ def format_time_value(real_t: Any, units: str = "") -> str:
     str
         Formatted time string
     """
+    # Unwrap 0-d arrays (e.g. coord.min().values) into hashable scalars
+    if isinstance(real_t, np.ndarray):
+        if real_t.ndim != 0:
+            return _format_time_value.__wrapped__(real_t, units)
+        real_t = real_t[()]
+
+    try:
+        return _format_time_value(real_t, units)
+    except TypeError:  # unhashable
+        return _format_time_value.__wrapped__(real_t, units)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _format_time_value(real_t: Any, units: str) -> str:
     # Handle datetime64
     if isinstance(real_t, (np.datetime64, np.ndarray)):
         try:
@@ -84,7 +140,8 @@ def extract_metadata_from_dataarray(da: xr.DataArray) -> Dict[str, str]:
 
 def build_metadata_markdown(
     da: xr.DataArray,
-    contour_da: xr.DataArray | None = None
+    contour_da: xr.DataArray | None = None,
+    cache_key: Optional[Hashable] = None
 ) -> str:
     """
     Build a formatted markdown string with DataArray metadata.
@@ -98,41 +155,59 @@ def build_metadata_markdown(
         Main variable DataArray
     contour_da : xr.DataArray, optional
         Contour overlay variable DataArray (if enabled)
+    cache_key : hashable, optional
+        Identity of the frame (e.g. simulation, variables, time, level and
+        region). When given, the markdown is memoized under this key, so
+        revisited frames skip the data range reductions and coordinate scans.
 
     Returns
     -------
     str
         Markdown-formatted metadata string
     """
-    lines = ["### Variable Metadata\n\n"]
+    if cache_key is None:
+        return _build_metadata_markdown(da, contour_da)
+
+    with _markdown_cache_lock:
+        markdown = _markdown_cache.get(cache_key)
+        if markdown is not None:
+            _markdown_cache.move_to_end(cache_key)
+            return markdown
+
+    markdown = _build_metadata_markdown(da, contour_da)
 
-    # Main variable metadata
-    var_meta = extract_metadata_from_dataarray(da)
+    with _markdown_cache_lock:
+        _markdown_cache[cache_key] = markdown
+        while len(_markdown_cache) > _MARKDOWN_CACHE_SIZE:
+            _markdown_cache.popitem(last=False)
+    return markdown
 
-    lines.append(f"- **Variable**: `{var_meta['name']}`\n")
-    lines.append(f"- **Long Name**: {var_meta['long_name']}\n")
-    lines.append(f"- **Units**: {var_meta['units']}\n")
 
-    # Dimensions
+def _build_metadata_markdown(da: xr.DataArray, contour_da: xr.DataArray | None) -> str:
     dims_str = " × ".join([f"{dim} ({da.sizes[dim]})" for dim in da.dims])
-    lines.append(f"- **Dimensions**: {dims_str}\n")
+    lines = [_MAIN_TEMPLATE.substitute(
+        variable=_VARIABLE_TEMPLATE.substitute(extract_metadata_from_dataarray(da)),
+        dims=dims_str
+    )]
 
     # Data range (compute only if data is small enough)
     try:
         if da.size < 1e6:  # Only compute for smaller arrays
-            data_min = float(da.min().values)
-            data_max = float(da.max().values)
+            # Materialize once and reduce in NumPy (NaN = masked terrain)
+            values = np.asarray(da.values)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN
+                data_min = float(np.nanmin(values))
+                data_max = float(np.nanmax(values))
             lines.append(f"- **Data Range**: [{data_min:.3e}, {data_max:.3e}]\n")
     except Exception:
         pass
 
     # Contour overlay metadata (if provided)
     if contour_da is not None:
-        contour_meta = extract_metadata_from_dataarray(contour_da)
-        lines.append("### Contour Overlay\n\n")
-        lines.append(f"- **Variable**: `{contour_meta['name']}`\n")
-        lines.append(f"- **Long Name**: {contour_meta['long_name']}\n")
-        lines.append(f"- **Units**: {contour_meta['units']}\n")
+        lines.append(_CONTOUR_TEMPLATE.substitute(
+            variable=_VARIABLE_TEMPLATE.substitute(extract_metadata_from_dataarray(contour_da))
+        ))
 
     # Coordinates info
     lines.append("\n---\n")
@@ -15,35 +15,26 @@ from functools import lru_cache
 logger = logging.getLogger(__name__)
 
 
-@lru_cache(maxsize=10)
-def load_boundary_paths(
-    shp_path: Path,
-    cache_key: str,
-    color: str = 'black',
-    line_width: float = 1.0
-) -> hv.Path:
+@lru_cache(maxsize=4)
+def read_boundary_vertices(shp_path: Path) -> np.ndarray:
     """
-    Load boundary paths from a shapefile with caching.
+    Read polygon boundaries from a shapefile as one vertex array.
 
-    This function reads polygon boundaries from a shapefile and converts them
-    to HoloViews Path objects for overlay on maps. Results are cached to avoid
-    repeated file I/O.
+    Polygons are flattened into a single read-only ``(n, 2)`` float32 array
+    with a NaN row after each polygon, the layout hv.Path renders as
+    separate lines. Cached per path: when loaded in the server parent before
+    workers fork, every worker shares the same pages copy-on-write instead
+    of parsing its own copy.
 
     Parameters
     ----------
     shp_path : Path
         Path to the shapefile (.shp file)
-    cache_key : str
-        Unique key for caching (e.g., 'county_black_1.0')
-    color : str, optional
-        Line color (default: 'black')
-    line_width : float, optional
-        Line width (default: 1.0)
 
     Returns
     -------
-    hv.Path
-        HoloViews Path object containing boundary polygons
+    np.ndarray
+        NaN-separated (lon, lat) vertices (empty if no valid polygons)
 
     Raises
     ------
@@ -51,12 +42,6 @@ def load_boundary_paths(
         If shapefile does not exist
     RuntimeError
         If shapefile cannot be read
-
-    Examples
-    --------
-    >>> from pathlib import Path
-    >>> county_path = Path('/data/shapefiles/county.shp')
-    >>> paths = load_boundary_paths(county_path, 'county', color='red', line_width=2.0)
     """
     if not shp_path.exists():
         raise FileNotFoundError(f"Shapefile not found: {shp_path}")
@@ -68,9 +53,7 @@ def load_boundary_paths(
         # Extract polygon segments
         path_segments = []
 
-        for shape_rec in sf.shapeRecords():
-            shape = shape_rec.shape
-
+        for shape in sf.shapes():
             # Handle different geometry types
             if shape.shapeType in [5, 15, 25]:  # Polygon types
                 # Extract points from the shape
@@ -79,45 +62,88 @@ def load_boundary_paths(
 
                 # Split into separate polygons if there are multiple parts
                 for i in range(len(parts) - 1):
-                    start = parts[i]
-                    end = parts[i + 1]
-                    polygon_points = points[start:end]
+                    polygon_points = points[parts[i]:parts[i + 1]]
 
                     if len(polygon_points) >= 3:  # Valid polygon needs at least 3 points
                         path_segments.append(polygon_points)
 
-        if not path_segments:
-            logger.warning(f"No valid polygons found in {shp_path}")
-            # Return empty path
-            return hv.Path([]).opts(color=color, line_width=line_width)
-
-        # Merge all segments with NaN separators for efficient rendering
-        total_points = sum(len(seg) for seg in path_segments)
-        total_len = total_points + len(path_segments)  # +1 NaN per segment
-        merged_data = np.full((total_len, 2), np.nan)
-
-        current_idx = 0
-        for seg in path_segments:
-            seg_array = np.array(seg) if not isinstance(seg, np.ndarray) else seg
-            n = len(seg_array)
-            merged_data[current_idx:current_idx + n] = seg_array
-            current_idx += n + 1  # Skip one for NaN separator
-
-        # Create HoloViews Path object with merged data
-        paths = hv.Path(
-            [merged_data],
-            kdims=['lon', 'lat']
-        ).opts(
-            color=color,
-            line_width=line_width,
-            tools=['hover']
-        )
-
-        return paths
-
     except Exception as e:
         raise RuntimeError(f"Failed to load shapefile {shp_path}: {e}")
 
+    # Merge all segments with NaN separators for efficient rendering
+    total_len = sum(len(seg) for seg in path_segments) + len(path_segments)
+    vertices = np.full((total_len, 2), np.nan, dtype=np.float32)
+
+    current_idx = 0
+    for seg in path_segments:
+        n = len(seg)
+        vertices[current_idx:current_idx + n] = seg
+        current_idx += n + 1  # Skip one for NaN separator
+
+    vertices.flags.writeable = False
+    return vertices
+
+
+@lru_cache(maxsize=10)
+def load_boundary_paths(
+    shp_path: Path,
+    cache_key: str,
+    color: str = 'black',
+    line_width: float = 1.0
+) -> hv.Path:
+    """
+    Load boundary paths from a shapefile with caching.
+
+    This function wraps the vertices from read_boundary_vertices in a
+    HoloViews Path object for overlay on maps. Results are cached to avoid
+    repeated file I/O.
+
+    Parameters
+    ----------
+    shp_path : Path
+        Path to the shapefile (.shp file)
+    cache_key : str
+        Unique key for caching (e.g., 'county_black_1.0')
+    color : str, optional
+        Line color (default: 'black')
+    line_width : float, optional
+        Line width (default: 1.0)
+
+    Returns
+    -------
+    hv.Path
+        HoloViews Path object containing boundary polygons
+
+    Raises
+    ------
+    FileNotFoundError
+        If shapefile does not exist
+    RuntimeError
+        If shapefile cannot be read
+
+    Examples
+    --------
+    >>> from pathlib import Path
+    >>> county_path = Path('/data/shapefiles/county.shp')
+    >>> paths = load_boundary_paths(county_path, 'county', color='red', line_width=2.0)
+    """
+    vertices = read_boundary_vertices(shp_path)
+
+    if len(vertices) == 0:
+        logger.warning(f"No valid polygons found in {shp_path}")
+        # Return empty path
+        return hv.Path([]).opts(color=color, line_width=line_width)
+
+    # Create HoloViews Path object with merged data
+    return hv.Path(
+        [vertices],
+        kdims=['lon', 'lat']
+    ).opts(
+        color=color,
+        line_width=line_width,
+        tools=['hover']
+    )
+
 
 def validate_shapefile(shp_path: Path) -> Tuple[bool, str]:
     """
@@ -0,0 +1,224 @@
+"""
+Size-Aware LRU Cache Module
+
+Provides an LRU cache bounded by an estimated byte budget rather than an
+entry count. Used for dataset-level caching where entries range from a few
+MB to several GB, so a fixed count either wastes memory or blows it.
+"""
+
+import threading
+import logging
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Size Estimation
+# =============================================================================
+
+def estimate_nbytes(value: Any) -> int:
+    """
+    Estimate the memory footprint of a cached value.
+
+    Uses the ``nbytes`` attribute exposed by xarray and numpy objects. For
+    lazily loaded datasets this is the size of the data once materialized,
+    which is the worst case the cache has to budget for.
+
+    Parameters
+    ----------
+    value : object
+        Cached value
+
+    Returns
+    -------
+    int
+        Estimated size in bytes (0 if unknown)
+    """
+    try:
+        return int(getattr(value, 'nbytes', 0))
+    except Exception:
+        return 0
+
+
+# =============================================================================
+# Sized LRU Cache
+# =============================================================================
+
+class SizedLRU:
+    """
+    Thread-safe LRU cache bounded by total estimated bytes.
+
+    Entries are evicted from the least recently used end until the total
+    estimated size fits ``max_bytes`` (and the entry count fits
+    ``max_entries`` if given). The most recent entry is always kept, even if
+    it alone exceeds the budget.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Byte budget for all cached values
+    max_entries : int, optional
+        Additional cap on the number of entries
+    on_evict : callable, optional
+        Called as ``on_evict(key, value)`` for each evicted entry, outside
+        the cache lock (e.g. to close file handles)
+    sizeof : callable, optional
+        Size estimator (default: estimate_nbytes)
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        max_entries: Optional[int] = None,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+        sizeof: Callable[[Any], int] = estimate_nbytes
+    ):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.on_evict = on_evict
+        self.sizeof = sizeof
+
+        self._data: 'OrderedDict[Hashable, Tuple[Any, int]]' = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key (marking it recently used)."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Insert or replace a value, evicting old entries as needed."""
+        nbytes = self.sizeof(value)
+
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old[1]
+
+            self._data[key] = (value, nbytes)
+            self._total_bytes += nbytes
+            evicted = self._evict_locked()
+
+        # A replaced value (e.g. two threads loading the same key) is
+        # released like an evicted one
+        if old is not None and old[0] is not value:
+            evicted.insert(0, (key, old[0]))
+
+        self._notify_evicted(evicted)
+
+    def _evict_locked(self) -> list:
+        """Pop entries over budget; caller must hold the lock."""
+        evicted = []
+        while len(self._data) > 1 and (
+            self._total_bytes > self.max_bytes
+            or (self.max_entries is not None and len(self._data) > self.max_entries)
+        ):
+            key, (value, nbytes) = self._data.popitem(last=False)
+            self._total_bytes -= nbytes
+            evicted.append((key, value))
+            logger.debug(f"SizedLRU EVICT: {key} ({nbytes} bytes)")
+        return evicted
+
+    def _notify_evicted(self, evicted: list) -> None:
+        """Run the eviction callback for each evicted entry."""
+        if self.on_evict is None:
+            return
+        for key, value in evicted:
+            try:
+                self.on_evict(key, value)
+            except Exception as e:
+                logger.warning(f"Eviction callback failed for {key}: {e}")
+
+    def clear(self) -> None:
+        """Remove all entries (running the eviction callback for each)."""
+        with self._lock:
+            evicted = [(key, value) for key, (value, _) in self._data.items()]
+            self._data.clear()
+            self._total_bytes = 0
+        self._notify_evicted(evicted)
+
+    @property
+    def total_bytes(self) -> int:
+        """Total estimated size of cached values."""
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+
+def sized_lru(
+    max_bytes: int,
+    max_entries: Optional[int] = None,
+    on_evict: Optional[Callable[[Hashable, Any], None]] = None
+) -> Callable:
+    """
+    Decorator caching a function's results in a SizedLRU.
+
+    Like functools.lru_cache, all arguments must be hashable. The wrapped
+    function exposes ``cache`` (the SizedLRU), ``cache_clear()`` and
+    ``cache_info()``.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Byte budget for cached results
+    max_entries : int, optional
+        Additional cap on the number of cached results
+    on_evict : callable, optional
+        Called as ``on_evict(args, value)`` for each evicted result
+
+    Returns
+    -------
+    callable
+        Decorator
+
+    Examples
+    --------
+    >>> @sized_lru(max_bytes=1 << 30)
+    ... def load(path):
+    ...     return xr.open_dataset(path)
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = SizedLRU(max_bytes, max_entries=max_entries, on_evict=on_evict)
+        missing = object()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args + tuple(sorted(kwargs.items())) if kwargs else args
+            value = cache.get(key, missing)
+            if value is missing:
+                value = func(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        def cache_info() -> dict:
+            return {
+                'hits': cache.hits,
+                'misses': cache.misses,
+                'entries': len(cache),
+                'bytes': cache.total_bytes,
+                'max_bytes': cache.max_bytes,
+            }
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        wrapper.cache_info = cache_info
+        return wrapper
+
+    return decorator
@@ -0,0 +1,113 @@
+"""
+Adaptive Throttle Module
+
+Coalesces bursts of widget events (slider drags, playback ticks) into at
+most one call per render interval. The first event after a quiet period
+runs immediately; later events only replace the pending arguments, and the
+latest ones run once the interval has elapsed. The interval grows with the
+measured run time, so slow renders are not queued back to back.
+"""
+
+import threading
+import logging
+from functools import update_wrapper
+from time import monotonic
+from typing import Callable, Optional, Tuple
+
+import panel as pn
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveThrottle:
+    """
+    Leading-edge + trailing-edge throttle with an adaptive interval.
+
+    Parameters
+    ----------
+    func : callable
+        Function to throttle
+    min_interval_ms : float, optional
+        Lower bound on the interval between runs (default: 250)
+
+    Notes
+    -----
+    Trailing runs are scheduled on the session's event loop with a one-shot
+    ``pn.state.add_periodic_callback``. Outside a session (no curdoc) every
+    call runs immediately.
+
+    Examples
+    --------
+    >>> throttled = AdaptiveThrottle(controller.update_plot, min_interval_ms=250)
+    >>> slider.param.watch(throttled, 'value')
+    """
+
+    def __init__(self, func: Callable, min_interval_ms: float = 250):
+        update_wrapper(self, func)
+        self.func = func
+        self.min_interval_ms = min_interval_ms
+        self.interval_ms = min_interval_ms
+
+        self._lock = threading.Lock()
+        self._pending: Optional[Tuple[tuple, dict]] = None
+        self._scheduled = False
+        self._running = False
+        self._last_end = 0.0
+
+    def __call__(self, *args, **kwargs) -> None:
+        if pn.state.curdoc is None:
+            self.func(*args, **kwargs)
+            return
+
+        with self._lock:
+            # Latest event wins; intermediate events are dropped
+            self._pending = (args, kwargs)
+            if self._running or self._scheduled:
+                return
+            wait_ms = (self._last_end - monotonic()) * 1000 + self.interval_ms
+            if wait_ms > 0:
+                self._schedule_locked(wait_ms)
+                return
+
+        self._run()
+
+    def _schedule_locked(self, wait_ms: float) -> None:
+        """Schedule one trailing run; caller must hold the lock."""
+        self._scheduled = True
+        pn.state.add_periodic_callback(self._fire, period=max(1, int(wait_ms)), count=1)
+
+    def _fire(self) -> None:
+        with self._lock:
+            self._scheduled = False
+            if self._running:
+                return
+        self._run()
+
+    def _run(self) -> None:
+        with self._lock:
+            if self._pending is None:
+                return
+            args, kwargs = self._pending
+            self._pending = None
+            self._running = True
+
+        start = monotonic()
+        try:
+            self.func(*args, **kwargs)
+        finally:
+            end = monotonic()
+            with self._lock:
+                self._running = False
+                self._last_end = end
+                self.interval_ms = max(self.min_interval_ms, (end - start) * 1000)
+                # Events that arrived during the run get one trailing run
+                if self._pending is not None and not self._scheduled:
+                    self._schedule_locked(self.interval_ms)
+
+    def cancel(self) -> None:
+        """Drop any pending call (a scheduled callback then does nothing)."""
+        with self._lock:
+            self._pending = None
+
+
+__all__ = ['AdaptiveThrottle']